@@ -0,0 +1,68 @@
+"""
+Shared pytest fixtures for the Skool scraper test scripts
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from test_selenium_mocks import (
+    MockWebDriver, TEST_VIDEO_URL, TEST_LESSON_TITLE, TEST_COMMUNITY_NAME, TEST_LESSONS,
+    TEST_NETWORK_VIDEO_URLS, create_mock_driver_with_video_data,
+    create_mock_driver_with_community_data, create_mock_driver_with_network_logs
+)
+
+
+# The mock graphs below are only read by the tests, so each is built once per session
+
+@pytest.fixture(scope="session")
+def video_driver():
+    """Mock driver serving TEST_VIDEO_URL for TEST_LESSON_TITLE"""
+    return create_mock_driver_with_video_data(TEST_VIDEO_URL, TEST_LESSON_TITLE)
+
+
+@pytest.fixture(scope="session")
+def community_driver():
+    """Mock driver listing TEST_LESSONS under TEST_COMMUNITY_NAME"""
+    return create_mock_driver_with_community_data(TEST_COMMUNITY_NAME, TEST_LESSONS)
+
+
+@pytest.fixture(scope="session")
+def network_driver():
+    """Mock driver whose network log holds one request per TEST_NETWORK_VIDEO_URLS entry"""
+    return create_mock_driver_with_network_logs(TEST_NETWORK_VIDEO_URLS)
+
+
+@pytest.fixture
+def empty_driver():
+    """Fresh, empty mock driver for tests that navigate or add elements"""
+    return MockWebDriver()
+
+
+@pytest.fixture(scope="session")
+def extractor():
+    """The shared video extractor instance"""
+    from skool_modules.video_extractor import get_video_extractor
+    return get_video_extractor()
+
+
+# A Mock spec'd on the Chrome driver takes several times longer to build than to reset, so
+# one is shared by the session and reset after every test that uses it
+
+@pytest.fixture(scope="session")
+def chrome_spec_mock():
+    """The session's unittest.mock.Mock spec'd on selenium's Chrome driver"""
+    from selenium import webdriver
+    return Mock(spec=webdriver.Chrome)
+
+
+@pytest.fixture
+def mock_driver(chrome_spec_mock):
+    """Chrome driver Mock with no calls, return values, side effects or assigned attributes"""
+    yield chrome_spec_mock
+    chrome_spec_mock.reset_mock(return_value=True, side_effect=True)
+
+    # reset_mock leaves plain values a test assigned over spec'd attributes, such as page_source
+    driver_attributes = vars(chrome_spec_mock).keys() & set(dir(chrome_spec_mock._spec_class))
+    for name in driver_attributes:
+        del vars(chrome_spec_mock)[name]
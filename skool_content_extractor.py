@@ -9,6 +9,7 @@ import os
 import time
 import re
 import json
+import functools
 import random
 import urllib.request
 import argparse
@@ -31,6 +32,13 @@ try:
 except Exception:
     pass
 
+# Aho-Corasick matching for lesson identifiers; falls back to plain substring scans
+try:
+    import ahocorasick  # type: ignore
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Read credentials from environment variables to avoid hardcoding secrets
 SKOOL_EMAIL = os.getenv("SKOOL_EMAIL", "")  # Skool email from environment
 SKOOL_PASSWORD = os.getenv("SKOOL_PASSWORD", "")  # Skool password from environment
@@ -85,6 +93,8 @@ def reset_session_tracking():
     SEEN_VIDEO_IDS_SESSION.clear()
     SESSION_VIDEO_TRACKING.clear()
     VIDEO_EXTRACTION_DEBUG_LOG.clear()
+    _extract_lesson_identifiers.cache_clear()
+    _lesson_identifier_trie.cache_clear()
     
     SESSION_STATS.update({
         'videos_processed': 0,
@@ -139,12 +149,22 @@ def register_video_in_session(video_url, lesson_title, extraction_method, platfo
     if platform:
         SESSION_STATS['platforms_detected'].add(platform)
     
-    # Check if this video ID has been seen before in this session
-    if video_id in SEEN_VIDEO_IDS_SESSION:
+    # Register the video unless this session has seen its ID before; setdefault does the
+    # membership check and the insert in one lookup and hands back the earlier record
+    record = {
+        'video_url': video_url,
+        'lesson_title': lesson_title,
+        'extraction_method': extraction_method,
+        'platform': platform,
+        'timestamp': datetime.datetime.now().isoformat(),
+        'order': len(SESSION_VIDEO_TRACKING) + 1
+    }
+    previous_info = SESSION_VIDEO_TRACKING.setdefault(video_id, record)
+    
+    if previous_info is not record:
         SESSION_STATS['duplicates_blocked'] += 1
         
         # Get previous usage info
-        previous_info = SESSION_VIDEO_TRACKING.get(video_id, {})
         previous_lesson = previous_info.get('lesson_title', 'Unknown')
         previous_method = previous_info.get('extraction_method', 'Unknown')
         previous_timestamp = previous_info.get('timestamp', 'Unknown')
@@ -175,16 +195,8 @@ def register_video_in_session(video_url, lesson_title, extraction_method, platfo
         
         return False  # Block this duplicate
     
-    # Register new video in session tracking
+    # New video: keep the ID set in step with the tracking dict
     SEEN_VIDEO_IDS_SESSION.add(video_id)
-    SESSION_VIDEO_TRACKING[video_id] = {
-        'video_url': video_url,
-        'lesson_title': lesson_title,
-        'extraction_method': extraction_method,
-        'platform': platform,
-        'timestamp': datetime.datetime.now().isoformat(),
-        'order': len(SESSION_VIDEO_TRACKING) + 1
-    }
     
     SESSION_STATS['unique_videos_found'] += 1
     
@@ -203,13 +215,75 @@ def register_video_in_session(video_url, lesson_title, extraction_method, platfo
         {
             'video_id': video_id,
             'platform': platform,
-            'session_order': SESSION_VIDEO_TRACKING[video_id]['order'],
+            'session_order': record['order'],
             'unique_count': SESSION_STATS['unique_videos_found']
         }
     )
     
     return True  # Allow this video
 
+def register_videos_in_session(videos):
+    """Register several (video_url, lesson_title, extraction_method, platform) videos at once
+
+    Returns one result per video, as register_video_in_session would. New videos are
+    added to the session tracking in batches; URLs without a video ID and duplicates
+    go through register_video_in_session so they are reported exactly as before.
+    """
+    import datetime
+
+    timestamp = datetime.datetime.now().isoformat()
+    pending = {}
+    results = []
+
+    def flush():
+        if not pending:
+            return
+        SEEN_VIDEO_IDS_SESSION.update(pending)
+        SESSION_VIDEO_TRACKING.update(pending)
+        unique_before = SESSION_STATS['unique_videos_found']
+        SESSION_STATS['videos_processed'] += len(pending)
+        SESSION_STATS['unique_videos_found'] += len(pending)
+        SESSION_STATS['extraction_methods_used'].update(info['extraction_method'] for info in pending.values())
+        SESSION_STATS['platforms_detected'].update(info['platform'] for info in pending.values() if info['platform'])
+
+        for unique_count, (video_id, info) in enumerate(pending.items(), unique_before + 1):
+            log_video_extraction_attempt(
+                f"{info['extraction_method']}_SESSION_REGISTERED",
+                info['lesson_title'],
+                info['video_url'],
+                'found',
+                {
+                    'video_id': video_id,
+                    'platform': info['platform'],
+                    'session_order': info['order'],
+                    'unique_count': unique_count
+                }
+            )
+        pending.clear()
+
+    for video_url, lesson_title, extraction_method, platform in videos:
+        video_id = _extract_video_id_generic(video_url) if video_url else None
+        if not video_id or video_id in SEEN_VIDEO_IDS_SESSION or video_id in pending:
+            # The single-video path must see everything registered so far
+            flush()
+            results.append(register_video_in_session(video_url, lesson_title, extraction_method, platform))
+            continue
+
+        pending[video_id] = {
+            'video_url': video_url,
+            'lesson_title': lesson_title,
+            'extraction_method': extraction_method,
+            'platform': platform,
+            'timestamp': timestamp,
+            'order': len(SESSION_VIDEO_TRACKING) + len(pending) + 1
+        }
+        results.append(True)
+
+    flush()
+    print(f"✅ SESSION TRACKING: {results.count(True)}/{len(results)} videos registered "
+          f"({SESSION_STATS['unique_videos_found']} unique this session)")
+    return results
+
 def check_session_duplicate_early(video_url, lesson_title, extraction_method):
     """Early duplicate detection before full validation - more efficient"""
     if not video_url:
@@ -256,30 +330,46 @@ def print_session_statistics():
     
     print("=" * 40)
 
-def save_session_tracking_report():
+def build_session_tracking_report():
+    """Build the session tracking report as a JSON-serializable dict"""
+    import datetime
+    
+    # Convert sets to lists for JSON serialization
+    session_stats_copy = dict(SESSION_STATS)
+    session_stats_copy['extraction_methods_used'] = list(SESSION_STATS['extraction_methods_used'])
+    session_stats_copy['platforms_detected'] = list(SESSION_STATS['platforms_detected'])
+    
+    return {
+        'session_stats': session_stats_copy,
+        'video_tracking': SESSION_VIDEO_TRACKING,
+        'seen_video_ids': list(SEEN_VIDEO_IDS_SESSION),
+        'lesson_context': LESSON_CONTEXT,
+        'browser_isolation': BROWSER_ISOLATION,
+        'report_generated': datetime.datetime.now().isoformat()
+    }
+
+def save_session_tracking_report(path='debug_session_tracking_report.json'):
     """Save detailed session tracking report to file"""
     try:
-        import json
-        import datetime
-        
-        # Convert sets to lists for JSON serialization
-        session_stats_copy = dict(SESSION_STATS)
-        session_stats_copy['extraction_methods_used'] = list(SESSION_STATS['extraction_methods_used'])
-        session_stats_copy['platforms_detected'] = list(SESSION_STATS['platforms_detected'])
-        
-        report = {
-            'session_stats': session_stats_copy,
-            'video_tracking': SESSION_VIDEO_TRACKING,
-            'seen_video_ids': list(SEEN_VIDEO_IDS_SESSION),
-            'lesson_context': LESSON_CONTEXT,
-            'browser_isolation': BROWSER_ISOLATION,
-            'report_generated': datetime.datetime.now().isoformat()
-        }
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
         
-        with open('debug_session_tracking_report.json', 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        report = build_session_tracking_report()
         
-        print(f"📄 Session tracking report saved: debug_session_tracking_report.json")
+        if orjson is not None:
+            # orjson serializes the whole report to UTF-8 bytes in one call
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            import json
+            
+            # json.dump emits many small chunks; buffer them into a few large writes
+            with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+        
+        print(f"📄 Session tracking report saved: {path}")
         
     except Exception as e:
         print(f"⚠️ Failed to save session tracking report: {e}")
@@ -506,6 +596,11 @@ def set_lesson_context(lesson_title, lesson_url=None, lesson_id=None):
     """Set the current lesson context for validation"""
     global LESSON_CONTEXT
     
+    # Build the lesson's identifier matcher up front; it is cached per title, outside
+    # LESSON_CONTEXT, which goes into the JSON session report
+    if lesson_title:
+        _lesson_identifier_trie(lesson_title)
+    
     LESSON_CONTEXT['current_lesson_title'] = lesson_title
     LESSON_CONTEXT['current_lesson_url'] = lesson_url
     LESSON_CONTEXT['current_lesson_id'] = lesson_id
@@ -592,16 +687,12 @@ def validate_video_belongs_to_lesson(video_url, lesson_title, driver=None):
     
     try:
         # Method 1: Check if video URL contains lesson-specific identifiers
-        lesson_identifiers = _extract_lesson_identifiers(lesson_title)
-        url_lower = video_url.lower()
-        
-        for identifier in lesson_identifiers:
-            if identifier.lower() in url_lower:
-                validation_result['valid'] = True
-                validation_result['reason'] = 'url_contains_lesson_identifier'
-                validation_result['confidence'] = 0.8
-                print(f"✅ URL contains lesson identifier: {identifier}")
-                break
+        identifier = find_lesson_identifier(video_url, lesson_title)
+        if identifier is not None:
+            validation_result['valid'] = True
+            validation_result['reason'] = 'url_contains_lesson_identifier'
+            validation_result['confidence'] = 0.8
+            print(f"✅ URL contains lesson identifier: {identifier}")
         
         # Method 2: Check if we're on the correct lesson page
         if driver and LESSON_CONTEXT['current_lesson_url']:
@@ -650,18 +741,22 @@ def validate_video_belongs_to_lesson(video_url, lesson_title, driver=None):
         LESSON_CONTEXT['lesson_validation_cache'][cache_key] = validation_result
         return False
 
+# Lesson title tokenization, compiled once at import
+_LESSON_WORD_RE = re.compile(r"\w+")
+_LESSON_NUM_RE = re.compile(r"\d+")
+_LESSON_COMMON_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'})
+
+@functools.lru_cache(maxsize=1024)
 def _extract_lesson_identifiers(lesson_title):
-    """Extract potential identifiers from lesson title for URL matching"""
+    """Extract potential identifiers from lesson title for URL matching (cached, returns a frozenset)"""
     identifiers = []
     
     # Add the full lesson title
     identifiers.append(lesson_title)
     
-    # Extract key words (remove common words)
-    common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'}
-    
-    words = lesson_title.lower().split()
-    key_words = [word for word in words if word not in common_words and len(word) > 2]
+    # Extract key words (remove common words); punctuation is not part of a word
+    words = _LESSON_WORD_RE.findall(lesson_title.lower())
+    key_words = [word for word in words if word not in _LESSON_COMMON_WORDS and len(word) > 2]
     
     # Add key word combinations
     for i in range(len(key_words)):
@@ -670,28 +765,89 @@ def _extract_lesson_identifiers(lesson_title):
             identifiers.append(f"{key_words[i]}-{key_words[i+1]}")
     
     # Add lesson number if present
-    import re
-    lesson_number_match = re.search(r'(\d+)', lesson_title)
+    lesson_number_match = _LESSON_NUM_RE.search(lesson_title)
     if lesson_number_match:
-        identifiers.append(lesson_number_match.group(1))
+        identifiers.append(lesson_number_match.group())
+    
+    return frozenset(identifiers)
+
+@functools.lru_cache(maxsize=1024)
+def _lesson_identifier_trie(lesson_title):
+    """Trie over the lesson's identifiers in URL form (cached per title)"""
+    from skool_modules.trie import Trie
+    return Trie(_url_form(identifier) for identifier in _extract_lesson_identifiers(lesson_title))
+
+def _build_keyword_automaton(keywords):
+    """Compile lowercase keywords into one Aho-Corasick automaton, or None if pyahocorasick is missing"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        if keyword:
+            automaton.add_word(keyword, keyword)
     
-    return identifiers
+    if len(automaton) == 0:
+        return None
+    
+    automaton.make_automaton()
+    return automaton
+
+def _find_keyword(text_lower, keywords_lower, automaton=None):
+    """Return the first lowercase keyword found in already-lowercased text, or None"""
+    if automaton is not None:
+        for _, keyword in automaton.iter(text_lower):
+            return keyword
+        return None
+    
+    for keyword in keywords_lower:
+        if keyword in text_lower:
+            return keyword
+    return None
+
+# Separators between the words of a URL path or query, or of a lesson title
+_URL_TOKEN_SPLIT_RE = re.compile(r"[\s/\-_?=.&:#]+")
+
+def _url_form(text):
+    """Lowercase text with each run of separators turned into one '-', like a URL slug"""
+    return "-".join(token for token in _URL_TOKEN_SPLIT_RE.split(text.lower()) if token)
+
+def find_lesson_identifier(video_url, lesson_title):
+    """Return the longest identifier of lesson_title, in URL form, that starts a URL token, or None"""
+    trie = _lesson_identifier_trie(lesson_title)
+    url = _url_form(video_url)
+    
+    # Multi-word identifiers ("money-mindset") span tokens, so match against the joined
+    # URL; starting only at token starts keeps "programming" out of "reprogramming"
+    start = 0
+    while start < len(url):
+        identifier = trie.find_longest_prefix_of(url, start)
+        if identifier is not None:
+            return identifier
+        start = url.find("-", start) + 1
+        if start == 0:
+            break
+    return None
+
+# Ordered from most to least common on a lesson page so the fallback scan stops early
+VIDEO_CONTEXT_KEYWORDS = ['lesson', 'video', 'watch', 'tutorial', 'play', 'demo']
+_VIDEO_CONTEXT_AUTOMATON = _build_keyword_automaton(VIDEO_CONTEXT_KEYWORDS)
 
 def _check_page_content_relevance(driver, lesson_title, video_url):
     """Check if page content is relevant to the lesson and video"""
     try:
         # Get page content
-        page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
+        page_text = driver.find_element(By.TAG_NAME, "body").text
+        page_text_lower = page_text.lower()
         lesson_lower = lesson_title.lower()
         
         # Check for lesson title in page content
-        title_present = lesson_lower in page_text
+        title_present = lesson_lower in page_text_lower
         if title_present:
             print(f"✅ Lesson title found in page content")
         
         # Check for video-related content near lesson title
-        video_keywords = ['video', 'watch', 'play', 'lesson', 'tutorial', 'demo']
-        video_context_present = any(keyword in page_text for keyword in video_keywords)
+        video_context_present = _find_keyword(page_text_lower, VIDEO_CONTEXT_KEYWORDS, _VIDEO_CONTEXT_AUTOMATON) is not None
         
         # Calculate relevance score
         relevance_score = 0.0
@@ -700,7 +856,7 @@ def _check_page_content_relevance(driver, lesson_title, video_url):
         if video_context_present:
             relevance_score += 0.3
         
-        # Check if video URL appears in page content
+        # Check if video URL appears in page content (case-sensitive: video IDs keep their case)
         if video_url in page_text:
             relevance_score += 0.3
             print(f"✅ Video URL found in page content")
@@ -1525,6 +1681,39 @@ def find_lesson_hierarchy_path(lesson_title, hierarchy):
             return item_data.get("path", "")
     return ""
 
+# Global blacklist of known problematic cached video IDs
+CACHED_VIDEO_BLACKLIST = frozenset({
+    "YTrIwmIdaJI",  # Generic header URL
+    "UDcrRdfB0x8",  # Problematic cached video 1
+    "7snrj0uEaDw",  # Problematic cached video 2
+    "65GvYDdzJWU",  # Persistent duplicate video (re-enabled)
+    # Add more as they're discovered
+})
+
+# Video ID patterns for the blacklist check, compiled once at import; the first match wins
+_VALIDATION_VIDEO_ID_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # YouTube variants (standard, embed, nocookie)
+    r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',
+    r'youtube\.com/embed/([a-zA-Z0-9_-]{11})',
+    r'youtube\-nocookie\.com/(?:embed/)?([a-zA-Z0-9_-]{11})',
+    # Vimeo
+    r'vimeo\.com/(\d+)',
+    # Loom
+    r'loom\.com/share/([a-zA-Z0-9_-]+)',
+    # Wistia
+    r'wistia\.com/medias/([a-zA-Z0-9_-]+)'
+))
+
+def _extract_validation_video_id(video_url):
+    """Return the video ID is_valid_lesson_video checks against the blacklist, or None"""
+    # We'll search the original URL first, but also a stripped variant (without query/fragment)
+    stripped_url = video_url.split('?')[0].split('#')[0]
+    for pattern in _VALIDATION_VIDEO_ID_PATTERNS:
+        match = pattern.search(video_url) or pattern.search(stripped_url)
+        if match:
+            return match.group(1)
+    return None
+
 def is_valid_lesson_video(video_url):
     """Centralized validation to prevent cached/duplicate videos from being returned"""
     print(f"🔍 VALIDATION CHECK: Testing URL: {video_url}")
@@ -1533,54 +1722,40 @@ def is_valid_lesson_video(video_url):
         print("🚫 VALIDATION FAILED: Empty URL")
         return False
     
-    # Global blacklist of known problematic cached video IDs
-    CACHED_VIDEO_BLACKLIST = [
-        "YTrIwmIdaJI",  # Generic header URL
-        "UDcrRdfB0x8",  # Problematic cached video 1
-        "7snrj0uEaDw",  # Problematic cached video 2
-        "65GvYDdzJWU",  # Persistent duplicate video (re-enabled)
-        # Add more as they're discovered
-    ]
+    # Extract video ID from various URL formats
+    video_id = _extract_validation_video_id(video_url)
+    if video_id is None:
+        print(f"⚠️ VALIDATION: No video ID extracted from URL: {video_url} - ALLOWING by default")
+        return True
     
-    print(f"🔍 VALIDATION: Blacklist contains: {CACHED_VIDEO_BLACKLIST}")
+    print(f"🔍 VALIDATION: Found video ID: {video_id}")
+    if video_id in CACHED_VIDEO_BLACKLIST:
+        print(f"🚫 BLOCKED cached video: {video_id} from URL: {video_url}")
+        return False
     
-    # Extract video ID from various URL formats
-    import re
-
-    # We'll search the original URL first, but also create a stripped variant (without query/fragment)
-    stripped_url = video_url.split('?')[0].split('#')[0]
-    print(f"🔍 VALIDATION: Original URL: {video_url}")
-    print(f"🔍 VALIDATION: Stripped URL: {stripped_url}")
-
-    video_id_patterns = [
-        # YouTube variants (standard, embed, nocookie)
-        r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        r'youtube\-nocookie\.com/(?:embed/)?([a-zA-Z0-9_-]{11})',
-        # Vimeo
-        r'vimeo\.com/(\d+)',
-        # Loom
-        r'loom\.com/share/([a-zA-Z0-9_-]+)',
-        # Wistia
-        r'wistia\.com/medias/([a-zA-Z0-9_-]+)'
-    ]
+    print(f"✅ VALIDATION: Video ID {video_id} is NOT in blacklist - ALLOWING")
+    return True
 
-    for i, pattern in enumerate(video_id_patterns):
-        print(f"🔍 VALIDATION: Testing pattern {i+1}: {pattern}")
-        # Try matching against the full URL first; if not found, match against the stripped version
-        match = re.search(pattern, video_url) or re.search(pattern, stripped_url)
-        if match:
-            video_id = match.group(1)
-            print(f"🔍 VALIDATION: Found video ID: {video_id}")
-            if video_id in CACHED_VIDEO_BLACKLIST:
-                print(f"🚫 BLOCKED cached video: {video_id} from URL: {video_url}")
-                return False
-            else:
-                print(f"✅ VALIDATION: Video ID {video_id} is NOT in blacklist - ALLOWING")
-                return True
+def is_valid_lesson_video_batch(video_urls):
+    """Validate several URLs at once; same verdicts as is_valid_lesson_video, one summary line"""
+    results = []
+    blocked_ids = set()
+    
+    for video_url in video_urls:
+        if not video_url:
+            results.append(False)
+            continue
+        
+        video_id = _extract_validation_video_id(video_url)
+        if video_id in CACHED_VIDEO_BLACKLIST:
+            blocked_ids.add(video_id)
+            results.append(False)
+        else:
+            results.append(True)
     
-    print(f"⚠️ VALIDATION: No video ID extracted from URL: {video_url} - ALLOWING by default")
-    return True
+    print(f"🔍 VALIDATION: {results.count(True)}/{len(results)} URLs allowed, "
+          f"blocked cached videos: {sorted(blocked_ids) or 'none'}")
+    return results
 
 def _extract_video_id_generic(video_url):
     """Extract a comparable video identifier for deduplication across platforms."""
@@ -10,6 +10,7 @@ Modules:
 - content_extractor: Text and image content extraction
 - session_tracker: Session-level tracking and statistics
 - lesson_validator: Lesson-specific validation and context
+- trie: Prefix tree for matching lesson identifiers in URLs
 - file_manager: File operations and hierarchical structure
 - config_manager: Configuration and environment management
 - main_extractor: Main orchestration and workflow
@@ -7,6 +7,7 @@ Includes custom exceptions, error categorization, recovery strategies, and user-
 """
 
 import sys
+import threading
 import traceback
 import time
 import random
@@ -110,6 +111,9 @@ class ErrorHandler:
             'recovered_errors': 0,
             'unrecovered_errors': 0
         }
+        # Handlers are shared across threads (see get_error_handler); the
+        # read-modify-write counter updates must not interleave
+        self._stats_lock = threading.Lock()
         self.recovery_strategies = self._setup_recovery_strategies()
         self.max_retries = get_config('MAX_RETRIES', 3)
         self.retry_delays = get_config('RETRY_DELAYS', [1, 2, 5])  # seconds
@@ -169,7 +173,7 @@ class ErrorHandler:
         
         # Check if error is recoverable
         if not error.recoverable:
-            self.error_stats['unrecovered_errors'] += 1
+            self._count('unrecovered_errors')
             self._handle_unrecoverable_error(error, context)
             return False
         
@@ -207,15 +211,22 @@ class ErrorHandler:
     
     def _update_error_stats(self, error: SkoolScraperError):
         """Update error statistics"""
-        self.error_stats['total_errors'] += 1
-        
-        # Update category stats
         category = error.category.value
-        self.error_stats['errors_by_category'][category] = self.error_stats['errors_by_category'].get(category, 0) + 1
-        
-        # Update severity stats
         severity = error.severity.value
-        self.error_stats['errors_by_severity'][severity] = self.error_stats['errors_by_severity'].get(severity, 0) + 1
+        
+        with self._stats_lock:
+            self.error_stats['total_errors'] += 1
+            
+            # Update category stats
+            self.error_stats['errors_by_category'][category] = self.error_stats['errors_by_category'].get(category, 0) + 1
+            
+            # Update severity stats
+            self.error_stats['errors_by_severity'][severity] = self.error_stats['errors_by_severity'].get(severity, 0) + 1
+    
+    def _count(self, key: str):
+        """Increment a top-level error statistics counter"""
+        with self._stats_lock:
+            self.error_stats[key] += 1
     
     def _log_error(self, error: SkoolScraperError, context: Dict[str, Any] = None):
         """Log error with context"""
@@ -250,14 +261,14 @@ class ErrorHandler:
             try:
                 self.logger.info(f"Attempting recovery strategy: {strategy.__name__}")
                 if strategy(error, context):
-                    self.error_stats['recovered_errors'] += 1
+                    self._count('recovered_errors')
                     self.logger.success(f"Successfully recovered from {error.category.value} error")
                     return True
             except Exception as recovery_error:
                 self.logger.warning(f"Recovery strategy {strategy.__name__} failed: {recovery_error}")
         
         # All recovery strategies failed
-        self.error_stats['unrecovered_errors'] += 1
+        self._count('unrecovered_errors')
         self.logger.error(f"Failed to recover from {error.category.value} error after trying all strategies")
         return False
     
@@ -394,7 +405,11 @@ class ErrorHandler:
     
     def get_error_statistics(self) -> Dict[str, Any]:
         """Get error statistics"""
-        return self.error_stats.copy()
+        with self._stats_lock:
+            stats = self.error_stats.copy()
+            stats['errors_by_category'] = dict(stats['errors_by_category'])
+            stats['errors_by_severity'] = dict(stats['errors_by_severity'])
+        return stats
     
     def print_error_statistics(self):
         """Print error statistics"""
@@ -421,12 +436,15 @@ class ErrorHandler:
 
 # Global error handler instance
 _error_handler = None
+_error_handler_lock = threading.Lock()
 
 def get_error_handler() -> ErrorHandler:
     """Get or create the global error handler instance"""
     global _error_handler
     if _error_handler is None:
-        _error_handler = ErrorHandler()
+        with _error_handler_lock:
+            if _error_handler is None:
+                _error_handler = ErrorHandler()
     return _error_handler
 
 def handle_error(error: Exception, context: Dict[str, Any] = None) -> bool:
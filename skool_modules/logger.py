@@ -7,11 +7,12 @@ Replaces print statements with structured logging for better debugging and monit
 """
 
 import logging
+import logging.handlers
 import os
 import sys
 import json
 import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterable, Tuple
 from pathlib import Path
 
 from .config_manager import get_config
@@ -19,12 +20,32 @@ from .config_manager import get_config
 class SkoolLogger:
     """Comprehensive logging system for Skool scraper"""
     
+    # Level and message prefix for each message kind; the methods of the same name log through it
+    EVENT_STYLES = {
+        'debug': (logging.DEBUG, ""),
+        'info': (logging.INFO, ""),
+        'warning': (logging.WARNING, "⚠️ "),
+        'error': (logging.ERROR, "❌ "),
+        'critical': (logging.CRITICAL, "🚨 "),
+        'success': (logging.INFO, "✅ "),
+        'progress': (logging.INFO, "📊 "),
+        'browser': (logging.INFO, "🌐 "),
+        'video': (logging.INFO, "🎥 "),
+        'lesson': (logging.INFO, "📚 "),
+        'isolation': (logging.INFO, "🔒 "),
+        'config': (logging.INFO, "⚙️ "),
+        'session': (logging.INFO, "📈 "),
+        'validation': (logging.INFO, "🔍 "),
+        'file_operation': (logging.INFO, "📁 "),
+    }
+    
     def __init__(self, name: str = "skool_scraper"):
         self.name = name
         self.logger = None
         self.log_file = None
         self.console_handler = None
         self.file_handler = None
+        self.memory_handler = None
         self.setup_logging()
     
     def setup_logging(self):
@@ -34,7 +55,11 @@ class SkoolLogger:
         self.logger = logging.getLogger(self.name)
         self.logger.setLevel(logging.DEBUG)
         
-        # Clear any existing handlers
+        # Clear any existing handlers; the logger is shared by name, so flush and close the
+        # previous instance's handlers first or its buffered records are lost
+        for handler in self.logger.handlers:
+            handler.flush()
+            handler.close()
         self.logger.handlers.clear()
         
         # Create formatters
@@ -64,71 +89,85 @@ class SkoolLogger:
         self.file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
         self.file_handler.setLevel(logging.DEBUG)
         self.file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(self.file_handler)
+        
+        # Buffer file writes; errors, lesson events and close/exit flush everything queued so
+        # far, and the buffer stays small so a hard crash loses little of the debug trail
+        self.memory_handler = logging.handlers.MemoryHandler(
+            capacity=64, flushLevel=logging.ERROR, target=self.file_handler
+        )
+        self.memory_handler.setLevel(logging.DEBUG)
+        self.logger.addHandler(self.memory_handler)
         
         # Log startup
         self.info("🚀 Skool Logger initialized")
         self.info(f"📁 Log file: {self.log_file}")
     
+    def _log(self, kind: str, message: str):
+        """Log message at the level and with the prefix EVENT_STYLES gives for kind"""
+        level, prefix = self.EVENT_STYLES[kind]
+        # stacklevel=2 keeps the public method, not this helper, as the record's funcName
+        self.logger.log(level, f"{prefix}{message}", stacklevel=2)
+    
     def debug(self, message: str):
         """Log debug message"""
-        self.logger.debug(message)
+        self._log('debug', message)
     
     def info(self, message: str):
         """Log info message"""
-        self.logger.info(message)
+        self._log('info', message)
     
     def warning(self, message: str):
         """Log warning message"""
-        self.logger.warning(f"⚠️ {message}")
+        self._log('warning', message)
     
     def error(self, message: str):
         """Log error message"""
-        self.logger.error(f"❌ {message}")
+        self._log('error', message)
     
     def critical(self, message: str):
         """Log critical message"""
-        self.logger.critical(f"🚨 {message}")
+        self._log('critical', message)
     
     def success(self, message: str):
         """Log success message"""
-        self.logger.info(f"✅ {message}")
+        self._log('success', message)
     
     def progress(self, message: str):
         """Log progress message"""
-        self.logger.info(f"📊 {message}")
+        self._log('progress', message)
     
     def browser(self, message: str):
         """Log browser-related message"""
-        self.logger.info(f"🌐 {message}")
+        self._log('browser', message)
     
     def video(self, message: str):
         """Log video-related message"""
-        self.logger.info(f"🎥 {message}")
+        self._log('video', message)
     
     def lesson(self, message: str):
-        """Log lesson-related message"""
-        self.logger.info(f"📚 {message}")
+        """Log lesson-related message and write the buffered records through, once per lesson"""
+        self._log('lesson', message)
+        self.flush()
     
     def isolation(self, message: str):
         """Log browser isolation message"""
-        self.logger.info(f"🔒 {message}")
+        self._log('isolation', message)
     
     def config(self, message: str):
         """Log configuration message"""
-        self.logger.info(f"⚙️ {message}")
+        self._log('config', message)
     
     def session(self, message: str):
         """Log session tracking message"""
-        self.logger.info(f"📈 {message}")
+        self._log('session', message)
     
     def validation(self, message: str):
         """Log validation message"""
-        self.logger.info(f"🔍 {message}")
+        self._log('validation', message)
     
     def file_operation(self, message: str):
         """Log file operation message"""
-        self.logger.info(f"📁 {message}")
+        self._log('file_operation', message)
     
     def exception(self, message: str, exc_info: bool = True):
         """Log exception with traceback"""
@@ -146,6 +185,12 @@ class SkoolLogger:
         elif level == "error":
             self.error(f"Data: {message}")
     
+    def log_batch(self, events: Iterable[Tuple[str, str]]):
+        """Log a series of (kind, message) events, kind being an EVENT_STYLES key"""
+        for kind, message in events:
+            level, prefix = self.EVENT_STYLES[kind]
+            self.logger.log(level, f"{prefix}{message}")
+    
     def log_performance(self, operation: str, duration: float, details: Dict[str, Any] = None):
         """Log performance metrics"""
         message = f"Performance | {operation} | {duration:.2f}s"
@@ -209,13 +254,21 @@ class SkoolLogger:
         """Get the current log file path"""
         return self.log_file
     
+    def flush(self):
+        """Write any buffered records through to the log file"""
+        if self.memory_handler:
+            self.memory_handler.flush()
+    
     def close(self):
         """Close logging handlers"""
+        self.info("🔚 Logger closed")
+        if self.memory_handler:
+            self.memory_handler.flush()
+            self.memory_handler.close()
         if self.console_handler:
             self.console_handler.close()
         if self.file_handler:
             self.file_handler.close()
-        self.info("🔚 Logger closed")
 
 # Global logger instance
 _global_logger = None
@@ -0,0 +1,56 @@
+"""
+Trie Module
+===========
+
+Minimal prefix tree used to match lesson identifiers against URL tokens.
+"""
+
+from typing import Iterable, Optional
+
+# Marks the node where an inserted word ends; never collides with a character key
+_END = None
+
+class Trie:
+    """Prefix tree over lowercase words"""
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._root = {}
+        for word in words:
+            self.insert(word)
+
+    def insert(self, word: str):
+        """Add a word to the trie (empty words are ignored)"""
+        if not word:
+            return
+
+        node = self._root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_END] = word
+
+    def find_prefix_of(self, word: str) -> Optional[str]:
+        """Return the shortest inserted word that is a prefix of word, or None"""
+        node = self._root
+        for char in word:
+            if _END in node:
+                return node[_END]
+            node = node.get(char)
+            if node is None:
+                return None
+        return node.get(_END)
+
+    def find_longest_prefix_of(self, word: str, start: int = 0) -> Optional[str]:
+        """Return the longest inserted word that is a prefix of word[start:], or None"""
+        node = self._root
+        longest = None
+        for index in range(start, len(word)):
+            if _END in node:
+                longest = node[_END]
+            node = node.get(word[index])
+            if node is None:
+                return longest
+        return node.get(_END, longest)
+
+    def contains_prefix_of(self, word: str) -> bool:
+        """Check whether any inserted word is a prefix of word"""
+        return self.find_prefix_of(word) is not None
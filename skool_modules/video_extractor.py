@@ -9,13 +9,16 @@ Includes multiple extraction methods, validation, and testing capabilities.
 import re
 import json
 import time
+import functools
+import threading
 import urllib.parse
-from typing import Dict, Any, Optional, List, Tuple
+from collections import Counter
+from typing import Dict, Any, Optional, List, Tuple, NamedTuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 
 from .logger import get_logger, log_video, log_extraction_attempt
 from .error_handler import (
@@ -24,49 +27,171 @@ from .error_handler import (
 )
 from .config_manager import get_config
 
+# Aho-Corasick scan for video URL markers; falls back to one str.find per marker
+try:
+    import ahocorasick  # type: ignore
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# orjson parses the __NEXT_DATA__ and network log payloads several times faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+class VideoURLInfo(NamedTuple):
+    """A recognised video platform URL"""
+    platform: str
+    video_id: str
+    normalized_url: str
+
+# (platform, URL marker, video ID pattern right after the marker, canonical URL template).
+# Order is priority: platforms are checked in this order and, within a platform, the first
+# rule that matches anywhere in the URL wins
+_VIDEO_URL_RULES = (
+    ('youtube', 'youtube.com/watch?v=', r'[a-zA-Z0-9_-]{11}', 'https://www.youtube.com/watch?v={}'),
+    ('youtube', 'youtu.be/', r'[a-zA-Z0-9_-]{11}', 'https://www.youtube.com/watch?v={}'),
+    ('youtube', 'youtube.com/embed/', r'[a-zA-Z0-9_-]{11}', 'https://www.youtube.com/watch?v={}'),
+    ('youtube', 'youtube.com/v/', r'[a-zA-Z0-9_-]{11}', 'https://www.youtube.com/watch?v={}'),
+    ('youtube', 'youtube-nocookie.com/embed/', r'[a-zA-Z0-9_-]{11}', 'https://www.youtube.com/watch?v={}'),
+    ('vimeo', 'vimeo.com/', r'\d+', 'https://www.vimeo.com/{}'),
+    ('vimeo', 'vimeo.com/embed/', r'\d+', 'https://www.vimeo.com/{}'),
+    ('vimeo', 'vimeo.com/video/', r'\d+', 'https://www.vimeo.com/{}'),
+    ('loom', 'loom.com/share/', r'[a-zA-Z0-9_-]+', 'https://www.loom.com/share/{}'),
+    ('loom', 'loom.com/embed/', r'[a-zA-Z0-9_-]+', 'https://www.loom.com/share/{}'),
+    ('wistia', 'wistia.com/medias/', r'[a-zA-Z0-9_-]+', 'https://www.wistia.com/medias/{}'),
+    # The iframe embeds come before the generic embed rule, which would take "iframe" as the ID
+    ('wistia', 'wistia.com/embed/iframe/', r'[a-zA-Z0-9_-]+', 'https://www.wistia.com/medias/{}'),
+    ('wistia', 'wistia.net/embed/iframe/', r'[a-zA-Z0-9_-]+', 'https://www.wistia.com/medias/{}'),
+    ('wistia', 'wistia.com/embed/', r'[a-zA-Z0-9_-]+', 'https://www.wistia.com/medias/{}'),
+)
+
+_VIDEO_ID_RES = tuple(re.compile(id_pattern, re.IGNORECASE) for _, _, id_pattern, _ in _VIDEO_URL_RULES)
+
+# Regex form of the rules, per platform
+_PLATFORM_PATTERNS: Dict[str, List[str]] = {}
+for _platform, _marker, _id_pattern, _ in _VIDEO_URL_RULES:
+    _PLATFORM_PATTERNS.setdefault(_platform, []).append(f"{re.escape(_marker)}({_id_pattern})")
+
+# Any YouTube watch, short, embed or /v/ URL in page source
+_LEGACY_YOUTUBE_ID_RE = re.compile(r'(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([a-zA-Z0-9_-]{11})')
+
+# Page scripts that read every candidate element and its URL attributes in one WebDriver
+# round trip; .src is the resolved property, which is what get_attribute("src") returns
+_IFRAME_SRCS_JS = "return Array.from(document.querySelectorAll('iframe'), f => [f, f.src]);"
+_VIDEO_SRCS_JS = "return Array.from(document.querySelectorAll('video'), v => v.src);"
+_PLAYER_ATTRS_JS = """
+return arguments[0].flatMap(selector => Array.from(document.querySelectorAll(selector), el => [
+    el, el.src || el.getAttribute('src'), el.getAttribute('data-src'),
+    el.getAttribute('data-video'), el.getAttribute('data-url')
+]));
+"""
+
+# Markers are matched case-insensitively; ASCII-only lowering keeps string offsets
+# identical, so a marker found in the lowered URL lines up with the original
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+def _build_marker_automaton():
+    """Map every URL marker to the rules that use it, or None without pyahocorasick"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    rules_by_marker: Dict[str, List[int]] = {}
+    for index, (_, marker, _, _) in enumerate(_VIDEO_URL_RULES):
+        rules_by_marker.setdefault(marker, []).append(index)
+    
+    automaton = ahocorasick.Automaton()
+    for marker, indexes in rules_by_marker.items():
+        automaton.add_word(marker, tuple(indexes))
+    automaton.make_automaton()
+    return automaton
+
+_MARKER_AUTOMATON = _build_marker_automaton()
+
+# The same embeds recur across lessons, so recent URL checks are memoized
+@functools.lru_cache(maxsize=4096)
+def _classify_video_url(url: str) -> Optional[VideoURLInfo]:
+    """Find the video platform, ID and canonical URL in one scan of url"""
+    
+    lowered = url.translate(_ASCII_LOWER)
+    
+    if _MARKER_AUTOMATON is not None:
+        # One pass collects every marker occurrence; try them in rule priority order
+        candidates = sorted(
+            (index, end + 1)
+            for end, indexes in _MARKER_AUTOMATON.iter(lowered)
+            for index in indexes
+        )
+    else:
+        candidates = []
+        for index, (_, marker, _, _) in enumerate(_VIDEO_URL_RULES):
+            position = lowered.find(marker)
+            while position != -1:
+                candidates.append((index, position + len(marker)))
+                position = lowered.find(marker, position + 1)
+    
+    for index, start in candidates:
+        match = _VIDEO_ID_RES[index].match(url, start)
+        if match:
+            platform, _, _, template = _VIDEO_URL_RULES[index]
+            video_id = match.group()
+            return VideoURLInfo(platform, video_id, template.format(video_id))
+    
+    return None
+
+# Direct video file extensions
+_VIDEO_FILE_EXTENSIONS = ('.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv')
+
+@functools.lru_cache(maxsize=4096)
+def _is_video_file_url(url: str) -> bool:
+    """Check for a direct video file URL by its path extension"""
+    return urllib.parse.urlparse(url).path.lower().endswith(_VIDEO_FILE_EXTENSIONS)
+
+class ExtractionStats:
+    """Running video extraction counters; the attribute names are the statistics keys
+    
+    `+= 1` on an int or a Counter entry is a read-modify-write, not an atomic
+    increment, and the extractor is shared across threads, so update and read
+    the counters while holding `lock`.
+    """
+    # Explicit slots rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('total_attempts', 'successful_extractions', 'failed_extractions',
+                 'method_usage', 'platform_usage', 'lock')
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.total_attempts = 0
+        self.successful_extractions = 0
+        self.failed_extractions = 0
+        self.method_usage = Counter()
+        self.platform_usage = Counter()
+
 class VideoExtractor:
     """Comprehensive video extraction system"""
     
     def __init__(self):
         self.logger = get_logger()
-        self.extraction_stats = {
-            'total_attempts': 0,
-            'successful_extractions': 0,
-            'failed_extractions': 0,
-            'method_usage': {},
-            'platform_usage': {}
-        }
+        self.extraction_stats = ExtractionStats()
         
         # Video platform patterns
-        self.platform_patterns = {
-            'youtube': [
-                r'(?:https?://)?(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',
-                r'(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-                r'(?:https?://)?(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})'
-            ],
-            'vimeo': [
-                r'(?:https?://)?(?:www\.)?vimeo\.com/(\d+)',
-                r'(?:https?://)?(?:www\.)?vimeo\.com/embed/(\d+)'
-            ],
-            'loom': [
-                r'(?:https?://)?(?:www\.)?loom\.com/share/([a-zA-Z0-9_-]+)',
-                r'(?:https?://)?(?:www\.)?loom\.com/embed/([a-zA-Z0-9_-]+)'
-            ],
-            'wistia': [
-                r'(?:https?://)?(?:www\.)?wistia\.com/medias/([a-zA-Z0-9_-]+)',
-                r'(?:https?://)?(?:www\.)?wistia\.com/embed/([a-zA-Z0-9_-]+)'
-            ]
-        }
+        self.platform_patterns = _PLATFORM_PATTERNS
         
-        # Video blacklist
-        self.video_blacklist = get_config('VIDEO_BLACKLIST', [])
-        self.cached_video_blacklist = get_config('CACHED_VIDEO_BLACKLIST', [])
+        # Video blacklist: the listed URLs or IDs plus the video ID behind each listed URL,
+        # so every URL form of a blacklisted video is rejected with one set lookup
+        blacklist = [*get_config('VIDEO_BLACKLIST', []), *get_config('CACHED_VIDEO_BLACKLIST', [])]
+        self.video_blacklist = frozenset(blacklist).union(
+            info.video_id for info in map(_classify_video_url, blacklist) if info
+        )
     
     @error_handler(category=ErrorCategory.EXTRACTION, severity=ErrorSeverity.MEDIUM)
     def extract_video_url(self, driver: webdriver.Chrome, lesson_title: str) -> Optional[str]:
         """Extract video URL using multiple methods"""
         
-        self.extraction_stats['total_attempts'] += 1
+        stats = self.extraction_stats
+        with stats.lock:
+            stats.total_attempts += 1
         self.logger.video(f"Starting video extraction for: {lesson_title}")
         
         # Method 1: JSON data extraction
@@ -94,7 +219,8 @@ class VideoExtractor:
         if video_url:
             return self._validate_and_normalize_url(video_url, lesson_title, "legacy")
         
-        self.extraction_stats['failed_extractions'] += 1
+        with stats.lock:
+            stats.failed_extractions += 1
         self.logger.warning(f"No video found for lesson: {lesson_title}")
         return None
     
@@ -105,7 +231,7 @@ class VideoExtractor:
             # Look for __NEXT_DATA__ script
             next_data_script = driver.find_element(By.ID, "__NEXT_DATA__")
             if next_data_script:
-                json_data = json.loads(next_data_script.get_attribute("innerHTML"))
+                json_data = _json_loads(next_data_script.get_attribute("innerHTML"))
                 
                 # Navigate through JSON structure to find video URLs
                 video_url = self._find_video_in_json(json_data)
@@ -113,34 +239,29 @@ class VideoExtractor:
                     self.logger.video(f"Found video in JSON data: {video_url}")
                     return video_url
                     
-        except (NoSuchElementException, json.JSONDecodeError, KeyError) as e:
+        except Exception as e:
             self.logger.debug(f"JSON extraction failed: {e}")
         
         return None
     
-    def _find_video_in_json(self, data: Any, path: str = "") -> Optional[str]:
-        """Recursively search JSON data for video URLs"""
-        
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                
+    def _find_video_in_json(self, data: Any) -> Optional[str]:
+        """Search JSON data depth-first for the first video URL under a video-like key"""
+        
+        # Explicit stack of (key, value) pairs instead of recursion; children are pushed
+        # in reverse so they pop in document order and the first match still wins
+        stack = [(None, data)]
+        while stack:
+            key, value = stack.pop()
+            
+            if isinstance(value, str):
                 # Check if this key might contain video data
-                if any(video_key in key.lower() for video_key in ['video', 'media', 'url', 'src']):
-                    if isinstance(value, str) and self._is_video_url(value):
+                if key is not None and any(video_key in key.lower() for video_key in ('video', 'media', 'url', 'src')):
+                    if self._is_video_url(value):
                         return value
-                
-                # Recursively search nested structures
-                result = self._find_video_in_json(value, current_path)
-                if result:
-                    return result
-                    
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]"
-                result = self._find_video_in_json(item, current_path)
-                if result:
-                    return result
+            elif isinstance(value, dict):
+                stack.extend(reversed(value.items()))
+            elif isinstance(value, list):
+                stack.extend((None, item) for item in reversed(value))
         
         return None
     
@@ -148,29 +269,25 @@ class VideoExtractor:
         """Extract video URL from iframe elements"""
         
         try:
-            # Find all iframe elements
-            iframes = driver.find_elements(By.TAG_NAME, "iframe")
+            # Find all iframe elements and their src in one call
+            iframes = driver.execute_script(_IFRAME_SRCS_JS) or []
             
-            for iframe in iframes:
+            for iframe, src in iframes:
                 try:
-                    src = iframe.get_attribute("src")
                     if src and self._is_video_url(src):
                         self.logger.video(f"Found video in iframe: {src}")
                         return src
                         
                     # Check iframe content for video elements
                     driver.switch_to.frame(iframe)
-                    video_elements = driver.find_elements(By.TAG_NAME, "video")
+                    video_srcs = driver.execute_script(_VIDEO_SRCS_JS) or []
+                    driver.switch_to.default_content()
                     
-                    for video in video_elements:
-                        src = video.get_attribute("src")
+                    for src in video_srcs:
                         if src and self._is_video_url(src):
-                            driver.switch_to.default_content()
                             self.logger.video(f"Found video in iframe video element: {src}")
                             return src
                     
-                    driver.switch_to.default_content()
-                    
                 except Exception as e:
                     driver.switch_to.default_content()
                     self.logger.debug(f"Iframe extraction error: {e}")
@@ -194,36 +311,29 @@ class VideoExtractor:
                 "[class*='player']"
             ]
             
-            for selector in video_selectors:
+            # Every matching element with its src, data-src, data-video and data-url, in selector order
+            players = driver.execute_script(_PLAYER_ATTRS_JS, video_selectors) or []
+            
+            for element, *urls in players:
+                # Try to get video URL from various attributes
+                for url in urls:
+                    if url and self._is_video_url(url):
+                        self.logger.video(f"Found video in player element: {url}")
+                        return url
+                
+                # Try clicking the element to trigger video loading
                 try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                    element.click()
+                    time.sleep(2)  # Wait for video to load
                     
-                    for element in elements:
-                        # Try to get video URL from various attributes
-                        for attr in ['src', 'data-src', 'data-video', 'data-url']:
-                            url = element.get_attribute(attr)
-                            if url and self._is_video_url(url):
-                                self.logger.video(f"Found video in player element: {url}")
-                                return url
-                        
-                        # Try clicking the element to trigger video loading
-                        try:
-                            element.click()
-                            time.sleep(2)  # Wait for video to load
-                            
-                            # Check if video URL appeared after clicking
-                            video_elements = driver.find_elements(By.TAG_NAME, "video")
-                            for video in video_elements:
-                                src = video.get_attribute("src")
-                                if src and self._is_video_url(src):
-                                    self.logger.video(f"Found video after clicking: {src}")
-                                    return src
-                                    
-                        except Exception as e:
-                            self.logger.debug(f"Click extraction error: {e}")
+                    # Check if video URL appeared after clicking
+                    for src in driver.execute_script(_VIDEO_SRCS_JS) or []:
+                        if src and self._is_video_url(src):
+                            self.logger.video(f"Found video after clicking: {src}")
+                            return src
                             
                 except Exception as e:
-                    self.logger.debug(f"Video player extraction error: {e}")
+                    self.logger.debug(f"Click extraction error: {e}")
                     
         except Exception as e:
             self.logger.debug(f"Video player extraction failed: {e}")
@@ -239,7 +349,7 @@ class VideoExtractor:
             
             for log in logs:
                 try:
-                    message = json.loads(log['message'])
+                    message = _json_loads(log['message'])
                     
                     if 'message' in message and message['message']['method'] == 'Network.responseReceived':
                         response = message['message']['params']['response']
@@ -264,21 +374,12 @@ class VideoExtractor:
             # Look for YouTube embed patterns in page source
             page_source = driver.page_source
             
-            # YouTube video ID patterns
-            youtube_patterns = [
-                r'youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-                r'youtu\.be/([a-zA-Z0-9_-]{11})',
-                r'youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-                r'youtube\.com/v/([a-zA-Z0-9_-]{11})'
-            ]
-            
-            for pattern in youtube_patterns:
-                matches = re.findall(pattern, page_source)
-                if matches:
-                    video_id = matches[0]
-                    video_url = f"https://www.youtube.com/watch?v={video_id}"
-                    self.logger.video(f"Found YouTube video: {video_url}")
-                    return video_url
+            # One pass over the page for any YouTube URL form; the first on the page wins
+            match = _LEGACY_YOUTUBE_ID_RE.search(page_source)
+            if match:
+                video_url = f"https://www.youtube.com/watch?v={match.group(1)}"
+                self.logger.video(f"Found YouTube video: {video_url}")
+                return video_url
                     
         except Exception as e:
             self.logger.debug(f"Legacy YouTube extraction failed: {e}")
@@ -292,21 +393,15 @@ class VideoExtractor:
             return False
         
         # Check against blacklists
-        if url in self.video_blacklist or url in self.cached_video_blacklist:
+        if url in self.video_blacklist:
             return False
         
         # Check for video platform patterns
-        for platform, patterns in self.platform_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, url, re.IGNORECASE):
-                    return True
-        
-        # Check for video file extensions
-        video_extensions = ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv']
-        parsed_url = urllib.parse.urlparse(url)
-        path = parsed_url.path.lower()
+        info = _classify_video_url(url)
+        if info:
+            return info.video_id not in self.video_blacklist
         
-        return any(path.endswith(ext) for ext in video_extensions)
+        return _is_video_file_url(url)
     
     def _validate_and_normalize_url(self, video_url: str, lesson_title: str, method: str) -> Optional[str]:
         """Validate and normalize video URL"""
@@ -314,14 +409,16 @@ class VideoExtractor:
         if not video_url:
             return None
         
-        # Update statistics
-        self.extraction_stats['successful_extractions'] += 1
-        self.extraction_stats['method_usage'][method] = self.extraction_stats['method_usage'].get(method, 0) + 1
-        
         # Determine platform
         platform = self._detect_platform(video_url)
-        if platform:
-            self.extraction_stats['platform_usage'][platform] = self.extraction_stats['platform_usage'].get(platform, 0) + 1
+        
+        # Update statistics
+        stats = self.extraction_stats
+        with stats.lock:
+            stats.successful_extractions += 1
+            stats.method_usage[method] += 1
+            if platform:
+                stats.platform_usage[platform] += 1
         
         # Normalize URL
         normalized_url = self._normalize_video_url(video_url)
@@ -342,60 +439,22 @@ class VideoExtractor:
         self.logger.success(f"Video extracted successfully using {method}: {normalized_url}")
         return normalized_url
     
+    def classify_url(self, url: str) -> Optional[VideoURLInfo]:
+        """Platform, video ID and canonical URL of a video platform URL, or None"""
+        return _classify_video_url(url)
+    
     def _detect_platform(self, url: str) -> Optional[str]:
         """Detect video platform from URL"""
-        
-        for platform, patterns in self.platform_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, url, re.IGNORECASE):
-                    return platform
-        
-        return None
+        # Same rules as classify_url, so a URL's platform is known exactly when it classifies
+        info = _classify_video_url(url)
+        return info.platform if info else None
     
     def _normalize_video_url(self, url: str) -> str:
         """Normalize video URL to canonical format"""
         
-        # YouTube normalization
-        youtube_patterns = [
-            (r'youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})', r'https://www.youtube.com/watch?v=\1'),
-            (r'youtu\.be/([a-zA-Z0-9_-]{11})', r'https://www.youtube.com/watch?v=\1'),
-            (r'youtube\.com/embed/([a-zA-Z0-9_-]{11})', r'https://www.youtube.com/watch?v=\1'),
-            (r'youtube\.com/v/([a-zA-Z0-9_-]{11})', r'https://www.youtube.com/watch?v=\1')
-        ]
-        
-        for pattern, replacement in youtube_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return re.sub(pattern, replacement, url, flags=re.IGNORECASE)
-        
-        # Vimeo normalization
-        vimeo_patterns = [
-            (r'vimeo\.com/(\d+)', r'https://www.vimeo.com/\1'),
-            (r'vimeo\.com/embed/(\d+)', r'https://www.vimeo.com/\1')
-        ]
-        
-        for pattern, replacement in vimeo_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return re.sub(pattern, replacement, url, flags=re.IGNORECASE)
-        
-        # Loom normalization
-        loom_patterns = [
-            (r'loom\.com/share/([a-zA-Z0-9_-]+)', r'https://www.loom.com/share/\1'),
-            (r'loom\.com/embed/([a-zA-Z0-9_-]+)', r'https://www.loom.com/share/\1')
-        ]
-        
-        for pattern, replacement in loom_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return re.sub(pattern, replacement, url, flags=re.IGNORECASE)
-        
-        # Wistia normalization
-        wistia_patterns = [
-            (r'wistia\.com/medias/([a-zA-Z0-9_-]+)', r'https://www.wistia.com/medias/\1'),
-            (r'wistia\.com/embed/([a-zA-Z0-9_-]+)', r'https://www.wistia.com/medias/\1')
-        ]
-        
-        for pattern, replacement in wistia_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return re.sub(pattern, replacement, url, flags=re.IGNORECASE)
+        info = _classify_video_url(url)
+        if info:
+            return info.normalized_url
         
         # Ensure URL has protocol
         if not url.startswith(('http://', 'https://')):
@@ -405,7 +464,16 @@ class VideoExtractor:
     
     def get_extraction_statistics(self) -> Dict[str, Any]:
         """Get video extraction statistics"""
-        return self.extraction_stats.copy()
+        # Copy under the lock so the counters are consistent with each other
+        stats = self.extraction_stats
+        with stats.lock:
+            return {
+                'total_attempts': stats.total_attempts,
+                'successful_extractions': stats.successful_extractions,
+                'failed_extractions': stats.failed_extractions,
+                'method_usage': dict(stats.method_usage),
+                'platform_usage': dict(stats.platform_usage)
+            }
     
     def print_extraction_statistics(self):
         """Print video extraction statistics"""
@@ -431,15 +499,10 @@ class VideoExtractor:
         
         self.logger.info("=" * 40)
 
-# Global video extractor instance
-_video_extractor = None
-
+@functools.cache
 def get_video_extractor() -> VideoExtractor:
     """Get or create the global video extractor instance"""
-    global _video_extractor
-    if _video_extractor is None:
-        _video_extractor = VideoExtractor()
-    return _video_extractor
+    return VideoExtractor()
 
 def extract_video_url(driver: webdriver.Chrome, lesson_title: str) -> Optional[str]:
     """Extract video URL using the global video extractor"""
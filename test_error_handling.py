@@ -6,10 +6,61 @@ Test script for the error handling system
 import sys
 import os
 import time
+import io
+import functools
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Full tracebacks on failure are opt-in (VERBOSE_TB=1)
+VERBOSE_TB = bool(os.environ.get("VERBOSE_TB"))
+
+class _PerThreadStdout:
+    """sys.stdout stand-in that routes each thread's writes to its own buffer, if it has one"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    
+    def write(self, text):
+        return getattr(self.local, 'buffer', self.stream).write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def buffered_output(test_func):
+    """Collect a test's console output and write it to stdout in one call"""
+    @functools.wraps(test_func)
+    def wrapper(*args, **kwargs):
+        installed = not isinstance(sys.stdout, _PerThreadStdout)
+        router = _PerThreadStdout(sys.stdout) if installed else sys.stdout
+        router.local.buffer = buffer = io.StringIO()
+        if installed:
+            sys.stdout = router
+        try:
+            return test_func(*args, **kwargs)
+        finally:
+            del router.local.buffer
+            if installed:
+                sys.stdout = router.stream
+            router.stream.write(buffer.getvalue())
+    return wrapper
+
+# Error handler shared by every test, looked up once
+_EH = None
+
+def _handler():
+    """Return the shared error handler, fetching it on first use"""
+    global _EH
+    if _EH is None:
+        from skool_modules.error_handler import get_error_handler
+        _EH = get_error_handler()
+    return _EH
+
+@buffered_output
 def test_error_handling_basic():
     """Test basic error handling functionality"""
     
@@ -18,7 +69,7 @@ def test_error_handling_basic():
     
     try:
         from skool_modules.error_handler import (
-            get_error_handler, handle_error, safe_execute,
+            handle_error, safe_execute,
             SkoolScraperError, NetworkError, BrowserError, AuthenticationError,
             ExtractionError, ValidationError, ConfigurationError, FileOperationError,
             TimeoutError, RateLimitError, ErrorCategory, ErrorSeverity,
@@ -31,7 +82,7 @@ def test_error_handling_basic():
         
         # Test 1: Error handler instance
         print("\n🔧 Testing error handler instance...")
-        error_handler = get_error_handler()
+        error_handler = _handler()
         print(f"✅ Error handler created: {type(error_handler).__name__}")
         
         # Test 2: Custom exceptions
@@ -90,10 +141,11 @@ def test_error_handling_basic():
         
     except Exception as e:
         print(f"❌ Basic error handling test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE_TB:
+            traceback.print_exc()
         return False
 
+@buffered_output
 def test_error_recovery():
     """Test error recovery strategies"""
     
@@ -101,7 +153,9 @@ def test_error_recovery():
     print("=" * 40)
     
     try:
-        from skool_modules.error_handler import handle_error, NetworkError, BrowserError
+        from skool_modules.error_handler import safe_execute, NetworkError, BrowserError
+        
+        error_handler = _handler()
         
         # Test 1: Network error recovery
         print("\n🌐 Testing network error recovery...")
@@ -111,7 +165,7 @@ def test_error_recovery():
             raise ConnectionError("Connection refused")
         
         context = {'operation': 'network_test', 'retry_count': 0}
-        success = handle_error(ConnectionError("Connection refused"), context)
+        success = error_handler.handle_error(ConnectionError("Connection refused"), context)
         print(f"✅ Network error recovery result: {success}")
         
         # Test 2: Browser error recovery
@@ -119,28 +173,35 @@ def test_error_recovery():
         
         browser_error = BrowserError("Element not found")
         context = {'driver': None, 'operation': 'browser_test'}
-        success = handle_error(browser_error, context)
+        success = error_handler.handle_error(browser_error, context)
         print(f"✅ Browser error recovery result: {success}")
         
         # Test 3: Safe execute function
         print("\n🛡️ Testing safe execute function...")
         
+        call_count = [0]
+        
         def risky_function():
-            if time.time() % 2 == 0:  # Simulate intermittent failure
+            call_count[0] += 1
+            if call_count[0] == 1:  # Fail on the first call only
                 raise ValueError("Random error")
             return "Success"
         
         success, result = safe_execute(risky_function, context={'test': True})
-        print(f"✅ Safe execute result: {success}, {result}")
+        print(f"✅ Safe execute result (first call fails): {success}, {result}")
+        
+        success, result = safe_execute(risky_function, context={'test': True})
+        print(f"✅ Safe execute result (second call succeeds): {success}, {result}")
         
         return True
         
     except Exception as e:
         print(f"❌ Error recovery test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE_TB:
+            traceback.print_exc()
         return False
 
+@buffered_output
 def test_error_decorator():
     """Test error handler decorator"""
     
@@ -173,10 +234,11 @@ def test_error_decorator():
         
     except Exception as e:
         print(f"❌ Error decorator test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE_TB:
+            traceback.print_exc()
         return False
 
+@buffered_output
 def test_error_statistics():
     """Test error statistics tracking"""
     
@@ -184,24 +246,26 @@ def test_error_statistics():
     print("=" * 40)
     
     try:
-        from skool_modules.error_handler import get_error_handler, NetworkError, BrowserError, ValidationError
+        from skool_modules.error_handler import NetworkError, BrowserError, ValidationError
         
-        error_handler = get_error_handler()
+        error_handler = _handler()
         
-        # Generate some test errors
+        # Generate some test errors (each instance is built right before it is handled)
         print("\n📊 Generating test errors...")
         
-        test_errors = [
-            NetworkError("Test network error 1"),
-            NetworkError("Test network error 2"),
-            BrowserError("Test browser error 1"),
-            ValidationError("Test validation error 1"),
-            ValidationError("Test validation error 2"),
-            ValidationError("Test validation error 3")
-        ]
+        test_cases = (
+            (NetworkError, "Test network error 1"),
+            (NetworkError, "Test network error 2"),
+            (BrowserError, "Test browser error 1"),
+            (ValidationError, "Test validation error 1"),
+            (ValidationError, "Test validation error 2"),
+            (ValidationError, "Test validation error 3")
+        )
         
-        for error in test_errors:
-            handle_error(error, {'test': True})
+        _handle = error_handler.handle_error
+        _context = {'test': True}
+        for error_class, message in test_cases:
+            _handle(error_class(message), _context)
         
         # Get and display statistics
         print("\n📈 Error Statistics:")
@@ -231,10 +295,42 @@ def test_error_statistics():
         
     except Exception as e:
         print(f"❌ Error statistics test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE_TB:
+            traceback.print_exc()
         return False
 
+@buffered_output
+def test_error_statistics_concurrent():
+    """Test that errors handled from several threads are all counted"""
+    from skool_modules.error_handler import ErrorHandler, ValidationError
+    
+    print("\n🧪 TESTING CONCURRENT ERROR STATISTICS")
+    print("=" * 40)
+    
+    # A private handler, so the counts don't depend on the other tests; validation
+    # errors are low severity and recover on the first retry, which is made instant
+    error_handler = ErrorHandler()
+    error_handler.retry_delays = [0]
+    errors_per_thread = 250
+    
+    def record_errors(_):
+        for _ in range(errors_per_thread):
+            error_handler.handle_error(ValidationError("Concurrent validation error"), {'test': True})
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(record_errors, range(4)))
+    
+    stats = error_handler.get_error_statistics()
+    print(f"Total Errors: {stats['total_errors']}")
+    
+    expected = 4 * errors_per_thread
+    assert stats['total_errors'] == expected
+    assert stats['recovered_errors'] == expected
+    assert stats['unrecovered_errors'] == 0
+    assert stats['errors_by_category'] == {'validation': expected}
+    assert stats['errors_by_severity'] == {'low': expected}
+
+@buffered_output
 def test_error_integration():
     """Test error handling integration with other modules"""
     
@@ -244,7 +340,9 @@ def test_error_integration():
     try:
         from skool_modules.browser_manager import should_use_browser_isolation
         from skool_modules.config_manager import get_config
-        from skool_modules.error_handler import handle_error, ConfigurationError
+        from skool_modules.error_handler import ConfigurationError
+        
+        error_handler = _handler()
         
         print("✅ Successfully imported integrated modules")
         
@@ -273,17 +371,18 @@ def test_error_integration():
             # Simulate a configuration error
             raise ConfigurationError("Test configuration error")
         except Exception as e:
-            success = handle_error(e, context)
+            success = error_handler.handle_error(e, context)
             print(f"✅ Error handling with context: {success}")
         
         return True
         
     except Exception as e:
         print(f"❌ Integration test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE_TB:
+            traceback.print_exc()
         return False
 
+@buffered_output
 def test_error_classification():
     """Test automatic error classification"""
     
@@ -293,21 +392,22 @@ def test_error_classification():
     try:
         from skool_modules.error_handler import handle_error
         
-        # Test different types of generic exceptions
-        test_exceptions = [
-            ("ConnectionError", ConnectionError("Connection refused")),
-            ("TimeoutError", TimeoutError("Operation timed out")),
-            ("FileNotFoundError", FileNotFoundError("File not found")),
-            ("PermissionError", PermissionError("Permission denied")),
-            ("ValueError", ValueError("Invalid value")),
-            ("KeyError", KeyError("Key not found"))
-        ]
-        
-        for exception_name, exception in test_exceptions:
+        # Test different types of generic exceptions (instances are built one at a time)
+        test_cases = (
+            (ConnectionError, "Connection refused"),
+            (TimeoutError, "Operation timed out"),
+            (FileNotFoundError, "File not found"),
+            (PermissionError, "Permission denied"),
+            (ValueError, "Invalid value"),
+            (KeyError, "Key not found")
+        )
+        
+        for exception_class, message in test_cases:
+            exception_name = exception_class.__name__
             print(f"\n🔍 Testing {exception_name}...")
             
             context = {'test_type': exception_name}
-            success = handle_error(exception, context)
+            success = handle_error(exception_class(message), context)
             
             print(f"✅ {exception_name} handled: {success}")
         
@@ -315,25 +415,70 @@ def test_error_classification():
         
     except Exception as e:
         print(f"❌ Error classification test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE_TB:
+            traceback.print_exc()
         return False
 
+TESTS = [
+    test_error_handling_basic,
+    test_error_recovery,
+    test_error_decorator,
+    test_error_statistics,
+    test_error_statistics_concurrent,
+    test_error_integration,
+    test_error_classification,
+]
+
+def _passed(test):
+    """Run a test for the script's own report; most return a bool, assert-style tests return None"""
+    try:
+        return test() is not False
+    except AssertionError as e:
+        print(f"❌ {test.__name__} failed: {e!r}")
+        if VERBOSE_TB:
+            traceback.print_exc()
+        return False
+
+# Tests that never read the error statistics. They still record errors on the
+# shared handler from several threads, which ErrorHandler serializes with its
+# stats lock; the statistics tests run afterwards, on their own
+PARALLEL_SAFE_TESTS = {
+    test_error_handling_basic,
+    test_error_recovery,
+    test_error_decorator,
+    test_error_classification,
+}
+
 if __name__ == "__main__":
     print("🚀 Starting Error Handling Tests")
     print()
     
-    # Run tests
-    test1_passed = test_error_handling_basic()
-    test2_passed = test_error_recovery()
-    test3_passed = test_error_decorator()
-    test4_passed = test_error_statistics()
-    test5_passed = test_error_integration()
-    test6_passed = test_error_classification()
+    # Run tests (ONLY=<substring> restricts the run to matching test names,
+    # PARALLEL=1 runs the independent tests in a thread pool)
+    tests = TESTS
+    if name_filter := os.environ.get("ONLY"):
+        tests = [test for test in TESTS if name_filter in test.__name__]
+    
+    if os.environ.get("PARALLEL"):
+        # Tests that don't read handler statistics run concurrently; most of
+        # their time is spent in recovery back-off sleeps
+        concurrent_tests = [test for test in tests if test in PARALLEL_SAFE_TESTS]
+        sequential_tests = [test for test in tests if test not in PARALLEL_SAFE_TESTS]
+        
+        sys.stdout = _PerThreadStdout(sys.stdout)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                outcomes = dict(zip(concurrent_tests, executor.map(_passed, concurrent_tests)))
+        finally:
+            sys.stdout = sys.stdout.stream
+        outcomes.update((test, _passed(test)) for test in sequential_tests)
+        results = [(test.__name__, outcomes[test]) for test in tests]
+    else:
+        results = [(test.__name__, _passed(test)) for test in tests]
     
     print()
     print("=" * 60)
-    if all([test1_passed, test2_passed, test3_passed, test4_passed, test5_passed, test6_passed]):
+    if all(passed for _, passed in results):
         print("✅ ALL TESTS PASSED - Error handling system is working!")
         print()
         print("🎯 Successfully implemented:")
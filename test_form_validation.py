@@ -8,48 +8,109 @@ Tests the Skool login form validation to understand why the submit button remain
 
 import sys
 import os
-import time
+import atexit
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 
-def test_form_validation():
+# Reads both field values and the submit button state in a single round-trip
+FORM_SNAPSHOT_SCRIPT = """
+const e = document.getElementById('email'),
+      p = document.getElementById('password'),
+      b = document.querySelector('button[type="submit"]');
+return {email: e.value, password: p.value, enabled: !b.disabled, btnText: b.innerText};
+"""
+
+# Fires one event type on every passed field, then reports the submit button state
+DISPATCH_EVENT_SCRIPT = """
+const eventName = arguments[0];
+for (let i = 1; i < arguments.length; i++) {
+    arguments[i].dispatchEvent(new Event(eventName, { bubbles: true }));
+}
+return !document.querySelector('button[type="submit"]').disabled;
+"""
+
+# Collects the text of every validation/error element in a single round-trip
+VALIDATION_MESSAGES_SCRIPT = """
+return [...document.querySelectorAll("[class*='error'], [class*='validation'], [class*='invalid']")]
+    .map(e => e.innerText);
+"""
+
+# Collects hidden inputs, checkboxes, required fields and form attributes in a single round-trip
+FORM_ELEMENTS_SCRIPT = """
+const f = document.querySelector('form');
+return {
+    hidden: [...document.querySelectorAll("input[type='hidden']")]
+        .map(e => ({name: e.getAttribute('name'), value: e.value})),
+    checkboxes: [...document.querySelectorAll("input[type='checkbox']")]
+        .map(e => ({name: e.getAttribute('name'), checked: e.checked})),
+    required: [...document.querySelectorAll('[required]')]
+        .map(e => ({tag: e.tagName.toLowerCase(), name: e.getAttribute('name'), id: e.id})),
+    form: f ? {action: f.getAttribute('action'), method: f.getAttribute('method'),
+               id: f.id, class: f.className} : null
+};
+"""
+
+# Shared Chrome session, created on first use and quit at interpreter exit
+_DRIVER = None
+
+def get_driver():
+    """Return the shared Chrome driver, starting it on first call"""
+    global _DRIVER
+    if _DRIVER is None:
+        chrome_options = Options()
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        
+        # Only the login form DOM is needed: return at DOMContentLoaded and skip images/CSS
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2
+        })
+        
+        _DRIVER = webdriver.Chrome(options=chrome_options)
+        _DRIVER.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        atexit.register(_DRIVER.quit)
+    return _DRIVER
+
+def snapshot_form(driver):
+    """Return the current login form state using one execute_script call"""
+    return driver.execute_script(FORM_SNAPSHOT_SCRIPT)
+
+def test_form_validation(driver=None):
     """Test and analyze the Skool login form validation"""
     
     print("🔍 TESTING SKOOL LOGIN FORM VALIDATION")
     print("=" * 50)
     
-    # Setup Chrome options
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    
     try:
-        # Create driver
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        driver = driver or get_driver()
         
         print("🌐 Navigating to Skool login page...")
         driver.get("https://www.skool.com/login")
         
-        # Wait for page to load
-        time.sleep(5)
+        # Wait for the login form instead of a fixed page-load delay
+        email_field = WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "email")))
         
         # Find form elements
-        email_field = driver.find_element(By.ID, "email")
         password_field = driver.find_element(By.ID, "password")
         submit_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
         
+        state = snapshot_form(driver)
         print(f"\n📋 INITIAL FORM STATE:")
-        print(f"   Email field value: '{email_field.get_attribute('value')}'")
-        print(f"   Password field value: '{password_field.get_attribute('value')}'")
-        print(f"   Submit button enabled: {submit_button.is_enabled()}")
-        print(f"   Submit button text: '{submit_button.text}'")
+        print(f"   Email field value: '{state['email']}'")
+        print(f"   Password field value: '{state['password']}'")
+        print(f"   Submit button enabled: {state['enabled']}")
+        print(f"   Submit button text: '{state['btnText']}'")
         
         # Test with valid email format
         test_email = "test@example.com"
@@ -60,90 +121,72 @@ def test_form_validation():
         # Clear and fill email field
         email_field.clear()
         email_field.send_keys(test_email)
-        time.sleep(1)
+        WebDriverWait(driver, 2).until(lambda d: email_field.get_attribute('value') == test_email)
         
+        state = snapshot_form(driver)
         print(f"   After email input:")
-        print(f"     Email field value: '{email_field.get_attribute('value')}'")
-        print(f"     Submit button enabled: {submit_button.is_enabled()}")
+        print(f"     Email field value: '{state['email']}'")
+        print(f"     Submit button enabled: {state['enabled']}")
         
         # Clear and fill password field
         password_field.clear()
         password_field.send_keys(test_password)
-        time.sleep(1)
+        WebDriverWait(driver, 2).until(lambda d: password_field.get_attribute('value') == test_password)
         
+        state = snapshot_form(driver)
         print(f"   After password input:")
-        print(f"     Password field value: '{password_field.get_attribute('value')}'")
-        print(f"     Submit button enabled: {submit_button.is_enabled()}")
+        print(f"     Password field value: '{state['password']}'")
+        print(f"     Submit button enabled: {state['enabled']}")
         
         # Check for any validation messages
-        validation_messages = driver.find_elements(By.CSS_SELECTOR, "[class*='error'], [class*='validation'], [class*='invalid']")
+        validation_messages = driver.execute_script(VALIDATION_MESSAGES_SCRIPT)
         if validation_messages:
             print(f"   Validation messages found:")
             for msg in validation_messages:
-                print(f"     - {msg.text}")
+                print(f"     - {msg}")
         
-        # Try triggering events
+        # Try triggering events (both fields per round-trip)
         print(f"\n🔄 TRIGGERING FORM EVENTS:")
         
-        # Trigger input events
-        driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", email_field)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", password_field)
-        time.sleep(0.5)
-        
-        print(f"   After input events:")
-        print(f"     Submit button enabled: {submit_button.is_enabled()}")
-        
-        # Trigger change events
-        driver.execute_script("arguments[0].dispatchEvent(new Event('change', { bubbles: true }));", email_field)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].dispatchEvent(new Event('change', { bubbles: true }));", password_field)
-        time.sleep(0.5)
-        
-        print(f"   After change events:")
-        print(f"     Submit button enabled: {submit_button.is_enabled()}")
-        
-        # Trigger blur events
-        driver.execute_script("arguments[0].dispatchEvent(new Event('blur', { bubbles: true }));", email_field)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].dispatchEvent(new Event('blur', { bubbles: true }));", password_field)
-        time.sleep(0.5)
-        
-        print(f"   After blur events:")
-        print(f"     Submit button enabled: {submit_button.is_enabled()}")
+        for event_name in ("input", "change", "blur"):
+            enabled = driver.execute_script(DISPATCH_EVENT_SCRIPT, event_name, email_field, password_field)
+            print(f"   After {event_name} events:")
+            print(f"     Submit button enabled: {enabled}")
         
         # Check for any hidden fields or additional requirements
         print(f"\n🔍 CHECKING FOR ADDITIONAL FORM ELEMENTS:")
         
+        elements = driver.execute_script(FORM_ELEMENTS_SCRIPT)
+        
         # Look for hidden fields
-        hidden_inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='hidden']")
+        hidden_inputs = elements['hidden']
         if hidden_inputs:
             print(f"   Hidden inputs found: {len(hidden_inputs)}")
             for i, hidden in enumerate(hidden_inputs):
-                print(f"     {i+1}. name='{hidden.get_attribute('name')}', value='{hidden.get_attribute('value')}'")
+                print(f"     {i+1}. name='{hidden['name']}', value='{hidden['value']}'")
         
         # Look for checkboxes
-        checkboxes = driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
+        checkboxes = elements['checkboxes']
         if checkboxes:
             print(f"   Checkboxes found: {len(checkboxes)}")
             for i, checkbox in enumerate(checkboxes):
-                print(f"     {i+1}. name='{checkbox.get_attribute('name')}', checked={checkbox.is_selected()}")
+                print(f"     {i+1}. name='{checkbox['name']}', checked={checkbox['checked']}")
         
         # Look for any required fields
-        required_fields = driver.find_elements(By.CSS_SELECTOR, "[required]")
+        required_fields = elements['required']
         if required_fields:
             print(f"   Required fields found: {len(required_fields)}")
             for i, field in enumerate(required_fields):
-                print(f"     {i+1}. tag='{field.tag_name}', name='{field.get_attribute('name')}', id='{field.get_attribute('id')}'")
+                print(f"     {i+1}. tag='{field['tag']}', name='{field['name']}', id='{field['id']}'")
         
         # Check form attributes
-        form = driver.find_element(By.CSS_SELECTOR, "form")
+        form = elements['form']
         if form:
             print(f"\n📝 FORM ATTRIBUTES:")
-            print(f"   Action: {form.get_attribute('action')}")
-            print(f"   Method: {form.get_attribute('method')}")
-            print(f"   ID: {form.get_attribute('id')}")
-            print(f"   Class: {form.get_attribute('class')}")
+            print(f"   Action: {form['action']}")
+            print(f"   Method: {form['method']}")
+            print(f"   ID: {form['id']}")
+            print(f"   Class: {form['class']}")
         
         # Try clicking the button even if disabled
         print(f"\n🖱️ TESTING BUTTON CLICK (even if disabled):")
@@ -154,28 +197,23 @@ def test_form_validation():
             print(f"   ❌ Button click failed: {e}")
         
         # Wait a bit more to see if anything changes
-        print(f"\n⏳ WAITING 5 SECONDS TO SEE IF BUTTON ENABLES...")
-        for i in range(5):
-            time.sleep(1)
-            enabled = submit_button.is_enabled()
-            print(f"   {i+1}s: Submit button enabled = {enabled}")
-            if enabled:
-                break
+        print(f"\n⏳ WAITING UP TO 5 SECONDS TO SEE IF BUTTON ENABLES...")
+        try:
+            WebDriverWait(driver, 5).until(lambda d: submit_button.is_enabled())
+            print(f"   Submit button enabled = True")
+        except TimeoutException:
+            print(f"   Submit button enabled = False (timed out)")
         
         # Final state
+        state = snapshot_form(driver)
         print(f"\n📊 FINAL FORM STATE:")
-        print(f"   Email field value: '{email_field.get_attribute('value')}'")
-        print(f"   Password field value: '{password_field.get_attribute('value')}'")
-        print(f"   Submit button enabled: {submit_button.is_enabled()}")
-        print(f"   Submit button text: '{submit_button.text}'")
+        print(f"   Email field value: '{state['email']}'")
+        print(f"   Password field value: '{state['password']}'")
+        print(f"   Submit button enabled: {state['enabled']}")
+        print(f"   Submit button text: '{state['btnText']}'")
         
     except Exception as e:
         print(f"❌ Error: {e}")
-    finally:
-        try:
-            driver.quit()
-        except:
-            pass
 
 if __name__ == "__main__":
     test_form_validation()
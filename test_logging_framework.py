@@ -30,11 +30,13 @@ def test_logging_framework():
         print("\n📝 Testing basic logging functions...")
         
         logger = get_logger("test_logger")
-        logger.info("This is an info message")
-        logger.success("This is a success message")
-        logger.warning("This is a warning message")
-        logger.error("This is an error message")
-        logger.debug("This is a debug message")
+        logger.log_batch([
+            ("info", "This is an info message"),
+            ("success", "This is a success message"),
+            ("warning", "This is a warning message"),
+            ("error", "This is an error message"),
+            ("debug", "This is a debug message"),
+        ])
         
         # Test 2: Specialized logging functions
         print("\n🎯 Testing specialized logging functions...")
@@ -121,14 +123,17 @@ def test_logging_framework():
         # Test 7: Logger instance methods
         print("\n🔧 Testing logger instance methods...")
         
-        logger.config("Configuration loaded successfully")
-        logger.session("Session tracking initialized")
-        logger.validation("Validation system ready")
-        logger.file_operation("File saved successfully")
+        logger.log_batch([
+            ("config", "Configuration loaded successfully"),
+            ("session", "Session tracking initialized"),
+            ("validation", "Validation system ready"),
+            ("file_operation", "File saved successfully"),
+        ])
         
         # Test 8: Log file verification
         print("\n📁 Verifying log file creation...")
         
+        logger.flush()  # file output is buffered until flushed
         log_file_path = logger.get_log_file_path()
         if os.path.exists(log_file_path):
             print(f"✅ Log file created: {log_file_path}")
@@ -200,17 +205,52 @@ def test_logging_integration():
         traceback.print_exc()
         return False
 
+def test_second_logger_keeps_first_log():
+    """A new SkoolLogger with the same name must flush the previous one's buffered records"""
+    from skool_modules.logger import SkoolLogger
+    
+    first = SkoolLogger("test_logger_handover")
+    first.debug("buffered before the handover")
+    second = SkoolLogger("test_logger_handover")
+    
+    with open(first.get_log_file_path(), encoding="utf-8") as f:
+        assert "buffered before the handover" in f.read()
+    second.close()
+
+def test_log_batch_respects_logger_filters():
+    """log_batch records go through the logger's filters and prefixes, like the per-event methods"""
+    from skool_modules.logger import SkoolLogger
+    
+    logger = SkoolLogger("test_logger_batch")
+    logger.logger.addFilter(lambda record: "dropped" not in record.getMessage())
+    logger.log_batch([("success", "kept"), ("error", "dropped")])
+    logger.flush()
+    
+    with open(logger.get_log_file_path(), encoding="utf-8") as f:
+        log_text = f.read()
+    assert "✅ kept" in log_text
+    assert "dropped" not in log_text
+    logger.close()
+
 def cleanup_test_files():
     """Clean up test files created during testing"""
-    import glob
+    # Clean up log files; scandir hands back cached entry types, so no glob/fnmatch or extra stats
+    try:
+        with os.scandir("debug_logs") as entries:
+            log_files = [entry.path for entry in entries
+                         if entry.is_file()
+                         and entry.name.startswith("skool_scraper_")
+                         and entry.name.endswith(".log")]
+    except FileNotFoundError:
+        return
     
-    # Clean up log files
-    log_files = glob.glob("debug_logs/skool_scraper_*.log")
     for log_file in log_files:
         try:
-            os.remove(log_file)
+            os.unlink(log_file)
             print(f"🧹 Cleaned up: {log_file}")
-        except Exception as e:
+        except FileNotFoundError:
+            pass
+        except OSError as e:
             print(f"⚠️ Could not remove {log_file}: {e}")
 
 if __name__ == "__main__":
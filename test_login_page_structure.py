@@ -8,12 +8,75 @@ Examines the actual structure of the Skool login page to identify correct select
 
 import sys
 import os
-import time
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+# Chrome options, built once. Images and translation are off since only the DOM matters here.
+# Options objects aren't safe to share between drivers started in parallel; copy.deepcopy first.
+_CHROME_OPTS = Options()
+for _arg in (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-features=Translate",
+):
+    _CHROME_OPTS.add_argument(_arg)
+_CHROME_OPTS.add_experimental_option("excludeSwitches", ["enable-automation"])
+_CHROME_OPTS.add_experimental_option('useAutomationExtension', False)
+
+# Runs querySelectorAll for each selector in the browser and returns plain element summaries
+QUERY_SELECTORS_SCRIPT = """
+return arguments[0].map(function (selector) {
+    try {
+        return Array.from(document.querySelectorAll(selector)).map(function (e) {
+            return {
+                tag: e.tagName.toLowerCase(),
+                type: e.getAttribute('type'),
+                name: e.getAttribute('name'),
+                id: e.getAttribute('id'),
+                placeholder: e.getAttribute('placeholder'),
+                text: e.innerText,
+                visible: e.offsetParent !== null,
+                enabled: !e.disabled
+            };
+        });
+    } catch (err) {
+        return {error: err.message};
+    }
+});
+"""
+
+# Which element attributes are worth printing for each kind of field
+EMAIL_FIELDS = [("Tag", "tag"), ("Type", "type"), ("Name", "name"), ("ID", "id"),
+                ("Placeholder", "placeholder"), ("Visible", "visible"), ("Enabled", "enabled")]
+PASSWORD_FIELDS = [("Tag", "tag"), ("Type", "type"), ("Name", "name"), ("ID", "id"),
+                   ("Visible", "visible"), ("Enabled", "enabled")]
+SUBMIT_FIELDS = [("Tag", "tag"), ("Type", "type"), ("Text", "text"),
+                 ("Visible", "visible"), ("Enabled", "enabled")]
+
+def is_jquery_selector(selector):
+    """:contains() is jQuery-only and not valid CSS, so the browser can't evaluate it"""
+    return ":contains(" in selector
+
+def print_selector_result(selector, elements, fields):
+    """Print what a single selector matched in the batched query"""
+    if is_jquery_selector(selector):
+        print(f"⚠️ Skipping non-CSS selector: {selector}")
+    elif isinstance(elements, dict):
+        print(f"⚠️ Error with selector {selector}: {elements.get('error')}")
+    elif elements:
+        print(f"✅ Found {len(elements)} element(s) with: {selector}")
+        for i, elem in enumerate(elements):
+            print(f"   Element {i+1}:")
+            for label, key in fields:
+                print(f"     - {label}: {elem.get(key)}")
+    else:
+        print(f"❌ No elements found with: {selector}")
 
 def test_login_page_structure():
     """Test and analyze the Skool login page structure"""
@@ -21,28 +84,26 @@ def test_login_page_structure():
     print("🔍 ANALYZING SKOOL LOGIN PAGE STRUCTURE")
     print("=" * 50)
     
-    # Setup Chrome options
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    
     try:
         # Create driver
-        driver = webdriver.Chrome(options=chrome_options)
+        driver = webdriver.Chrome(options=_CHROME_OPTS)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
         print("🌐 Navigating to Skool login page...")
         driver.get("https://www.skool.com/login")
         
-        # Wait for page to load
-        time.sleep(5)
+        # Wait for the login form instead of a fixed delay
+        try:
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, "input[type='password'], input[type='email']")))
+        except TimeoutException:
+            print("⚠️ Login form did not appear within 10s, inspecting the page as-is")
         
         print(f"📄 Page Title: {driver.title}")
         print(f"🌐 Current URL: {driver.current_url}")
-        print(f"📏 Page Source Length: {len(driver.page_source)}")
+        # page_source re-serializes the whole DOM on every access, so fetch it once
+        page_source = driver.page_source
+        print(f"📏 Page Source Length: {len(page_source)}")
         
         # Look for email fields with various selectors
         email_selectors = [
@@ -56,28 +117,6 @@ def test_login_page_structure():
             "input[autocomplete='email']"
         ]
         
-        print("\n🔍 SEARCHING FOR EMAIL FIELDS:")
-        print("-" * 30)
-        
-        for selector in email_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    print(f"✅ Found {len(elements)} element(s) with: {selector}")
-                    for i, elem in enumerate(elements):
-                        print(f"   Element {i+1}:")
-                        print(f"     - Tag: {elem.tag_name}")
-                        print(f"     - Type: {elem.get_attribute('type')}")
-                        print(f"     - Name: {elem.get_attribute('name')}")
-                        print(f"     - ID: {elem.get_attribute('id')}")
-                        print(f"     - Placeholder: {elem.get_attribute('placeholder')}")
-                        print(f"     - Visible: {elem.is_displayed()}")
-                        print(f"     - Enabled: {elem.is_enabled()}")
-                else:
-                    print(f"❌ No elements found with: {selector}")
-            except Exception as e:
-                print(f"⚠️ Error with selector {selector}: {e}")
-        
         # Look for password fields
         password_selectors = [
             "input[name='password']",
@@ -88,27 +127,6 @@ def test_login_page_structure():
             "input[autocomplete='current-password']"
         ]
         
-        print("\n🔒 SEARCHING FOR PASSWORD FIELDS:")
-        print("-" * 30)
-        
-        for selector in password_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    print(f"✅ Found {len(elements)} element(s) with: {selector}")
-                    for i, elem in enumerate(elements):
-                        print(f"   Element {i+1}:")
-                        print(f"     - Tag: {elem.tag_name}")
-                        print(f"     - Type: {elem.get_attribute('type')}")
-                        print(f"     - Name: {elem.get_attribute('name')}")
-                        print(f"     - ID: {elem.get_attribute('id')}")
-                        print(f"     - Visible: {elem.is_displayed()}")
-                        print(f"     - Enabled: {elem.is_enabled()}")
-                else:
-                    print(f"❌ No elements found with: {selector}")
-            except Exception as e:
-                print(f"⚠️ Error with selector {selector}: {e}")
-        
         # Look for submit buttons
         submit_selectors = [
             "button[type='submit']",
@@ -121,29 +139,26 @@ def test_login_page_structure():
             "button[class*='submit']"
         ]
         
-        print("\n🖱️ SEARCHING FOR SUBMIT BUTTONS:")
-        print("-" * 30)
+        # Query every selector in one round-trip instead of one find_elements call each
+        sections = [
+            ("\n🔍 SEARCHING FOR EMAIL FIELDS:", email_selectors, EMAIL_FIELDS),
+            ("\n🔒 SEARCHING FOR PASSWORD FIELDS:", password_selectors, PASSWORD_FIELDS),
+            ("\n🖱️ SEARCHING FOR SUBMIT BUTTONS:", submit_selectors, SUBMIT_FIELDS),
+        ]
+        css_selectors = [selector for _, selectors, _ in sections
+                         for selector in selectors if not is_jquery_selector(selector)]
+        results = dict(zip(css_selectors, driver.execute_script(QUERY_SELECTORS_SCRIPT, css_selectors)))
         
-        for selector in submit_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    print(f"✅ Found {len(elements)} element(s) with: {selector}")
-                    for i, elem in enumerate(elements):
-                        print(f"   Element {i+1}:")
-                        print(f"     - Tag: {elem.tag_name}")
-                        print(f"     - Type: {elem.get_attribute('type')}")
-                        print(f"     - Text: {elem.text}")
-                        print(f"     - Visible: {elem.is_displayed()}")
-                        print(f"     - Enabled: {elem.is_enabled()}")
-                else:
-                    print(f"❌ No elements found with: {selector}")
-            except Exception as e:
-                print(f"⚠️ Error with selector {selector}: {e}")
+        for heading, selectors, fields in sections:
+            print(heading)
+            print("-" * 30)
+            for selector in selectors:
+                print_selector_result(selector, results.get(selector), fields)
         
         # Save page source for manual inspection
         with open("login_page_source.html", "w", encoding="utf-8") as f:
-            f.write(driver.page_source)
+            f.write(page_source)
+        page_source = None  # let the large string go before the screenshot
         print(f"\n💾 Page source saved to: login_page_source.html")
         
         # Take screenshot
@@ -1,18 +1,123 @@
 #!/usr/bin/env python3
 """
 Test script for the modal video extraction fix
+
+With CI or SKOOL_TEST_OFFLINE set, the test skips Chrome and the Skool login
+and runs the extractor against a scripted driver that replays the lesson's
+thumbnail-then-modal behaviour.
+
+Set CHROMEDRIVER_PATH to use an existing chromedriver binary and skip
+webdriver-manager entirely. For offline CI runs that still go through
+webdriver-manager, set WDM_LOCAL=1 and WDM_SSL_VERIFY=0.
 """
 
 import sys
 import os
+import functools
+from unittest.mock import Mock, patch
 
 # Add the current directory to Python path so we can import the main scraper
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from skool_content_extractor import *
+OFFLINE = bool(os.environ.get("CI") or os.environ.get("SKOOL_TEST_OFFLINE"))
+
+# YouTube embed the New Society lesson's modal opens
+OFFLINE_EMBED_URL = "https://www.youtube.com/embed/dQw4w9WgXcQ?rel=0&modestbranding=1"
+
+class OfflineModalDriver:
+    """Scripted stand-in for Chrome on a lesson whose video opens in a modal.
+
+    The page holds one video thumbnail (with a duration label). Clicking it
+    opens a dialog containing the YouTube embed iframe and grows the page
+    source, which is what detect_modal_video_player looks for.
+    """
+    
+    def __init__(self, url: str):
+        self.current_url = url
+        self.title = "New Society Classroom"
+        self.modal_open = False
+        
+        self.thumbnail = Mock(text="12:34")
+        self.thumbnail.click.side_effect = self._open_modal
+        
+        iframe = Mock()
+        iframe.get_attribute.side_effect = lambda name: OFFLINE_EMBED_URL if name == "src" else None
+        
+        self.modal = Mock()
+        self.modal.is_displayed.return_value = True
+        self.modal.get_attribute.side_effect = lambda name: f'<iframe src="{OFFLINE_EMBED_URL}"></iframe>'
+        self.modal.find_elements.side_effect = lambda by, selector: [iframe] if selector == "iframe" else []
+    
+    def _open_modal(self):
+        self.modal_open = True
+    
+    @property
+    def page_source(self) -> str:
+        return "<html><body>lesson</body></html>" + (" " * 5000 if self.modal_open else "")
+    
+    def execute_script(self, script, *args):
+        if args and args[0] is self.thumbnail:
+            self._open_modal()
+    
+    def find_elements(self, by, selector):
+        if "VideoThumbnail" in selector:
+            return [self.thumbnail]
+        if self.modal_open and selector == '[role="dialog"]':
+            return [self.modal]
+        return []
+    
+    def find_element(self, by, selector):
+        return Mock()
+    
+    def quit(self):
+        pass
+
+@functools.lru_cache(maxsize=1)
+def _driver_path():
+    """Resolve the ChromeDriver binary once; install() checks the latest version over HTTPS"""
+    if os.environ.get("CHROMEDRIVER_PATH"):
+        return os.environ["CHROMEDRIVER_PATH"]
+    
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+@functools.lru_cache(maxsize=1)
+def _chrome_options():
+    """Build the Chrome options once; a factory keeps selenium out of module import.
+
+    Images and translation are off to cut the bytes each page load pulls in.
+    Options objects aren't safe to share between drivers started in parallel;
+    copy.deepcopy the result first if that ever happens.
+    """
+    from selenium.webdriver.chrome.options import Options
+    
+    options = Options()
+    for arg in (
+        "--disable-gpu",
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-extensions",
+        "--disable-popup-blocking",
+        "--start-maximized",
+        "--log-level=WARNING",
+        "--blink-settings=imagesEnabled=false",
+        "--disable-features=Translate",
+    ):
+        options.add_argument(arg)
+    return options
 
 def test_modal_extraction():
     """Test the modal video extraction on the problematic New Society classroom"""
+    # Imported here so collecting this module doesn't load selenium and the whole scraper
+    from skool_content_extractor import (
+        login_to_skool, detect_modal_video_player, extract_video_url,
+        webdriver, SKOOL_EMAIL, SKOOL_PASSWORD
+    )
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
     
     # Test URL from the user's screenshots
     test_url = "https://www.skool.com/new-society/classroom/f767704b?md=bb5837236f46b7b7db77dfd55c63f2"
@@ -22,41 +127,42 @@ def test_modal_extraction():
     print(f"📍 Test URL: {test_url}")
     print()
     
+    sleep_patcher = None
     try:
-        # Setup WebDriver
-        print("🔧 Setting up WebDriver...")
-        chrome_options = Options()
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--log-level=WARNING")
-        
-        # Use webdriver-manager to handle ChromeDriver
-        from webdriver_manager.chrome import ChromeDriverManager
-        from selenium.webdriver.chrome.service import Service
-        
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        print("✅ WebDriver setup successful")
-        
-        # Login to Skool
-        print("🔐 Logging in to Skool...")
-        if not login_to_skool(driver):
-            print("❌ Login failed")
-            return False
-        
-        print("✅ Login successful")
-        
-        # Navigate to test lesson
-        print(f"🌐 Navigating to test lesson...")
-        driver.get(test_url)
-        time.sleep(5)  # Wait for page to load
-        
-        print("✅ Page loaded successfully")
+        if OFFLINE:
+            print("🧪 Offline mode: replaying the lesson with a scripted driver (no Chrome, no login)")
+            driver = OfflineModalDriver(test_url)
+            
+            # The extractor's fixed waits have nothing to wait for offline
+            sleep_patcher = patch("time.sleep")
+            sleep_patcher.start()
+        else:
+            # Setup WebDriver
+            print("🔧 Setting up WebDriver...")
+            # Use webdriver-manager to handle ChromeDriver
+            service = Service(_driver_path())
+            driver = webdriver.Chrome(service=service, options=_chrome_options())
+            
+            print("✅ WebDriver setup successful")
+            
+            # Login to Skool
+            print("🔐 Logging in to Skool...")
+            if not login_to_skool(driver, SKOOL_EMAIL, SKOOL_PASSWORD):
+                print("❌ Login failed")
+                return False
+            
+            print("✅ Login successful")
+            
+            # Navigate to test lesson
+            print(f"🌐 Navigating to test lesson...")
+            driver.get(test_url)
+            # Wait for the lesson's video container instead of a fixed delay
+            try:
+                WebDriverWait(driver, 10).until(EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "iframe, video, [class*='video']")))
+                print("✅ Page loaded successfully")
+            except TimeoutException:
+                print("⚠️ No video container appeared within 10s, trying extraction anyway")
         
         # Test the modal video extraction
         print("🎯 Testing modal video extraction...")
@@ -91,6 +197,8 @@ def test_modal_extraction():
         return False
         
     finally:
+        if sleep_patcher:
+            sleep_patcher.stop()
         try:
             driver.quit()
             print("🔧 WebDriver closed")
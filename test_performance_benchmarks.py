@@ -11,27 +11,95 @@ identifies performance bottlenecks.
 import sys
 import os
 import time
-import json
-import statistics
-from unittest.mock import Mock, patch
-from typing import Dict, Any, List, Optional, Tuple
+import gc
+import functools
+import itertools
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from contextlib import contextmanager
 
+# statistics, json, psutil and the skool_modules are imported where they are
+# used, so `--select` runs only pay for the benchmark groups they ask for
+
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Try to import psutil, fallback to simple memory tracking
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-    print("⚠️  psutil not available, using simple memory tracking")
+# Worker pool shared by the concurrent benchmarks, created on first use so
+# thread start-up is not part of what they measure
+_POOL = None
+
+def _get_pool():
+    """Return the shared benchmark thread pool, creating it on first use"""
+    global _POOL
+    if _POOL is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="benchmark")
+    return _POOL
+
+def _shutdown_pool():
+    """Stop the shared benchmark thread pool if it was started"""
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=True)
+        _POOL = None
+
+def _duration_stats(durations_ns: List[float]) -> Dict[str, float]:
+    """Summarize per-call durations given in ns; all returned values are in seconds.
+    
+    Uses numpy's vectorized reductions when it is installed, which matters for
+    the long runs adaptive sizing produces, and the statistics module otherwise.
+    GC pauses and scheduling hiccups skew the mean, so the median and a 10%
+    trimmed mean are reported as steadier headline numbers, plus p95/p99 tails.
+    """
+    count = len(durations_ns)
+    trim = count // 10
+    
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    
+    if np is not None:
+        durations = np.asarray(durations_ns, dtype=np.float64)
+        p50, p95, p99 = np.percentile(durations, [50, 95, 99])
+        stats = {
+            "mean": durations.mean(),
+            "min": durations.min(),
+            "max": durations.max(),
+            "std": durations.std(ddof=1) if count > 1 else 0.0,
+            "median": p50,
+            "trimmed_mean": np.sort(durations)[trim:count - trim].mean(),
+            "p95": p95,
+            "p99": p99
+        }
+    else:
+        import statistics
+        
+        ordered = sorted(durations_ns)
+        # "inclusive" interpolates like numpy.percentile's default
+        percentiles = statistics.quantiles(ordered, n=100, method="inclusive") if count > 1 else ordered * 99
+        stats = {
+            "mean": statistics.fmean(ordered),
+            "min": ordered[0],
+            "max": ordered[-1],
+            "std": statistics.stdev(ordered) if count > 1 else 0.0,
+            "median": statistics.median(ordered),
+            "trimmed_mean": statistics.fmean(ordered[trim:count - trim]),
+            "p95": percentiles[94],
+            "p99": percentiles[98]
+        }
+    
+    return {name: float(value) / 1e9 for name, value in stats.items()}
 
 @dataclass
 class BenchmarkResult:
     """Result of a performance benchmark"""
+    # Explicit slots (dataclass(slots=True) needs 3.10) keep the harness's own
+    # footprint out of the memory benchmarks
+    __slots__ = ('operation', 'duration', 'memory_usage', 'iterations', 'avg_duration',
+                 'min_duration', 'max_duration', 'std_deviation', 'median_duration',
+                 'trimmed_mean', 'success_rate', 'details')
+    
     operation: str
     duration: float
     memory_usage: float
@@ -40,22 +108,88 @@ class BenchmarkResult:
     min_duration: float
     max_duration: float
     std_deviation: float
+    median_duration: float
+    trimmed_mean: float
     success_rate: float
     details: Dict[str, Any]
 
 class PerformanceBenchmark:
     """Performance benchmarking system"""
     
-    def __init__(self):
+    # Bounds for adaptively chosen iteration counts
+    TARGET_DURATION_NS = 1_000_000_000
+    MIN_ITERATIONS = 10
+    MAX_ITERATIONS = 1_000_000
+    
+    def __init__(self, keep_samples: bool = False, pin_cpu: bool = False):
+        """With keep_samples=True every per-call duration and memory delta is kept in result details.
+        
+        pin_cpu=True pins the whole process to one CPU (and raises its priority
+        where psutil allows) so the scheduler cannot migrate it between cores
+        mid-run. Raising priority usually needs admin/root rights; failures are
+        reported and the benchmark runs unpinned.
+        """
         self.results = []
-        if PSUTIL_AVAILABLE:
-            self.process = psutil.Process()
-        else:
-            self.process = None
+        self.keep_samples = keep_samples
+        self.pinned_cpu = self._pin_to_cpu() if pin_cpu else None
+        self.process = None
+        self._statm_fd = None
+        
+        # On Linux read RSS straight from /proc; psutil costs tens of
+        # microseconds per call, which swamps the fast benchmarks
+        if sys.platform.startswith('linux'):
+            try:
+                self._statm_fd = open('/proc/self/statm', 'rb')
+                self._mb_per_page = os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+            except (OSError, ValueError):
+                self._statm_fd = None
+        
+        if self._statm_fd is None:
+            try:
+                import psutil
+                self.process = psutil.Process()
+            except ImportError:
+                print("⚠️  psutil not available, using simple memory tracking")
+    
+    @staticmethod
+    def _pin_to_cpu() -> Optional[int]:
+        """Pin this process to the first CPU it may run on; return that CPU or None"""
+        cpu = None
+        if hasattr(os, 'sched_setaffinity'):
+            try:
+                cpu = min(os.sched_getaffinity(0))
+                os.sched_setaffinity(0, {cpu})
+            except OSError as e:
+                print(f"⚠️  Could not pin benchmarks to a CPU: {e}")
+                cpu = None
+        
+        try:
+            import psutil
+        except ImportError:
+            return cpu
+        
+        process = psutil.Process()
+        try:
+            if cpu is None and hasattr(process, 'cpu_affinity'):
+                cpu = min(process.cpu_affinity())
+                process.cpu_affinity([cpu])
+            if hasattr(psutil, 'HIGH_PRIORITY_CLASS'):
+                process.nice(psutil.HIGH_PRIORITY_CLASS)
+        except (psutil.Error, OSError) as e:
+            print(f"⚠️  Could not pin or prioritize benchmarks: {e}")
+        return cpu
+    
+    @property
+    def memory_tracked(self) -> bool:
+        """Whether get_memory_usage reports real numbers"""
+        return self._statm_fd is not None or self.process is not None
     
     def get_memory_usage(self) -> float:
-        """Get current memory usage in MB"""
-        if PSUTIL_AVAILABLE and self.process:
+        """Get current memory usage (RSS) in MB"""
+        if self._statm_fd is not None:
+            self._statm_fd.seek(0)
+            return int(self._statm_fd.read().split()[1]) * self._mb_per_page
+        elif self.process:
             return self.process.memory_info().rss / 1024 / 1024
         else:
             # Simple fallback - return 0 for memory tracking
@@ -64,7 +198,7 @@ class PerformanceBenchmark:
     @contextmanager
     def measure_performance(self, operation: str):
         """Context manager for measuring performance"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         start_memory = self.get_memory_usage()
         
         try:
@@ -74,10 +208,10 @@ class PerformanceBenchmark:
             success = False
             raise e
         finally:
-            end_time = time.time()
+            end_ns = time.perf_counter_ns()
             end_memory = self.get_memory_usage()
             
-            duration = end_time - start_time
+            duration = (end_ns - start_ns) / 1e9
             memory_usage = end_memory - start_memory
             
             result = BenchmarkResult(
@@ -89,47 +223,118 @@ class PerformanceBenchmark:
                 min_duration=duration,
                 max_duration=duration,
                 std_deviation=0.0,
+                median_duration=duration,
+                trimmed_mean=duration,
                 success_rate=1.0 if success else 0.0,
                 details={}
             )
             self.results.append(result)
     
-    def benchmark_function(self, func, operation: str, iterations: int = 10, 
-                          *args, **kwargs) -> BenchmarkResult:
-        """Benchmark a function with multiple iterations"""
+    def benchmark_function(self, func, operation: str, iterations: Optional[int] = None, 
+                          *args, warmup: int = 3, inner_iters: Optional[int] = None,
+                          setup: Optional[Callable[[], Any]] = None,
+                          per_iter_args: Optional[Sequence[Any]] = None, **kwargs) -> BenchmarkResult:
+        """Benchmark a function with multiple iterations, after `warmup` untimed calls.
         
-        durations = []
+        Each iteration times a batch of `inner_iters` back-to-back calls and
+        records the per-call average, as timeit does, so sub-microsecond
+        functions are not drowned out by the timer itself. With
+        inner_iters=None the batch size and with iterations=None the count
+        are picked from a short pilot run so the timed loop takes about
+        TARGET_DURATION_NS in total.
+        
+        If `setup` is given it is called once per call of `func`, before the
+        clock starts, and its return value is passed to `func` as the first
+        argument; use it for per-call fixtures such as fresh mock drivers.
+        `per_iter_args` is a shorthand for cycling through a fixed list of
+        inputs, so a benchmark can exercise several code paths in turn.
+        
+        Raises RuntimeError when every timed call raised, since the timings
+        would then only measure the cost of failing.
+        """
+        
+        if per_iter_args is not None:
+            if setup is not None:
+                raise ValueError("pass either setup or per_iter_args, not both")
+            setup = functools.partial(next, itertools.cycle(per_iter_args))
+        
+        # First calls pay for imports, cache fills and other one-off setup; keep them out of the stats
+        for _ in range(warmup):
+            try:
+                if setup is None:
+                    func(*args, **kwargs)
+                else:
+                    func(setup(), *args, **kwargs)
+            except Exception:
+                pass
+        
+        if iterations is None or inner_iters is None:
+            per_call_ns = self._pilot_call_ns(func, setup, *args, **kwargs)
+            if inner_iters is None:
+                inner_iters = self._pick_inner_iters(per_call_ns)
+            if iterations is None:
+                batch_ns = max(per_call_ns * inner_iters, 1)
+                iterations = max(self.MIN_ITERATIONS,
+                                 min(self.MAX_ITERATIONS, int(self.TARGET_DURATION_NS / batch_ns)))
+        
+        durations_ns = []
         memory_usage = []
         successes = 0
+        last_error = None
         
-        for i in range(iterations):
-            start_time = time.time()
-            start_memory = self.get_memory_usage()
-            
-            try:
-                result = func(*args, **kwargs)
-                success = True
-                successes += 1
-            except Exception as e:
-                success = False
-                result = None
-            
-            end_time = time.time()
-            end_memory = self.get_memory_usage()
-            
-            duration = end_time - start_time
-            memory = end_memory - start_memory
-            
-            durations.append(duration)
-            memory_usage.append(memory)
+        # Bind the timer and memory probe locally; attribute lookups would
+        # otherwise show up in the timings of sub-microsecond functions
+        perf_counter_ns = time.perf_counter_ns
+        get_memory_usage = self.get_memory_usage
+        
+        batch = itertools.repeat
+        
+        # Like timeit, keep the collector from firing mid-iteration: collect
+        # pending garbage up front and switch GC off while timing
+        gc_was_enabled = gc.isenabled()
+        gc.collect()
+        gc.disable()
+        try:
+            # Memory is sampled once per batch, outside the timed section
+            for i in range(iterations):
+                if setup is not None:
+                    inputs = [setup() for _ in batch(None, inner_iters)]
+                
+                start_memory = get_memory_usage()
+                start_ns = perf_counter_ns()
+                
+                if setup is None:
+                    for _ in batch(None, inner_iters):
+                        try:
+                            func(*args, **kwargs)
+                            successes += 1
+                        except Exception as e:
+                            last_error = e
+                else:
+                    for value in inputs:
+                        try:
+                            func(value, *args, **kwargs)
+                            successes += 1
+                        except Exception as e:
+                            last_error = e
+                
+                end_ns = perf_counter_ns()
+                end_memory = get_memory_usage()
+                
+                durations_ns.append((end_ns - start_ns) / inner_iters)
+                memory_usage.append(end_memory - start_memory)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
         
-        # Calculate statistics
-        avg_duration = statistics.mean(durations)
-        min_duration = min(durations)
-        max_duration = max(durations)
-        std_deviation = statistics.stdev(durations) if len(durations) > 1 else 0.0
-        avg_memory = statistics.mean(memory_usage)
-        success_rate = successes / iterations
+        if not successes:
+            raise RuntimeError(f"every call of {operation} raised: {last_error!r}") from last_error
+        
+        # Calculate statistics (durations are kept in ns until here)
+        stats = _duration_stats(durations_ns)
+        avg_duration = stats["mean"]
+        avg_memory = sum(memory_usage) / len(memory_usage)
+        success_rate = successes / (iterations * inner_iters)
         
         result = BenchmarkResult(
             operation=operation,
@@ -137,20 +342,62 @@ class PerformanceBenchmark:
             memory_usage=avg_memory,
             iterations=iterations,
             avg_duration=avg_duration,
-            min_duration=min_duration,
-            max_duration=max_duration,
-            std_deviation=std_deviation,
+            min_duration=stats["min"],
+            max_duration=stats["max"],
+            std_deviation=stats["std"],
+            median_duration=stats["median"],
+            trimmed_mean=stats["trimmed_mean"],
             success_rate=success_rate,
             details={
-                "all_durations": durations,
-                "all_memory": memory_usage,
-                "successes": successes
+                "successes": successes,
+                "warmup": warmup,
+                "inner_iters": inner_iters,
+                "p95_duration": stats["p95"],
+                "p99_duration": stats["p99"]
             }
         )
         
+        if self.keep_samples:
+            result.details["all_durations"] = [duration_ns / 1e9 for duration_ns in durations_ns]
+            result.details["all_memory"] = memory_usage
+        
         self.results.append(result)
         return result
     
+    def _pilot_call_ns(self, func, setup, *args, **kwargs) -> int:
+        """Estimate the cost of one call in ns from a short pilot run.
+        
+        Like timeit.autorange, the pilot grows by 10x until it lasts at least
+        0.2ms, so a single slow call is enough but fast calls are not judged
+        by the timer's own resolution.
+        """
+        pilot_calls = 1
+        while True:
+            if setup is None:
+                calls = [functools.partial(func, *args, **kwargs)] * pilot_calls
+            else:
+                calls = [functools.partial(func, setup(), *args, **kwargs) for _ in range(pilot_calls)]
+            
+            start_ns = time.perf_counter_ns()
+            for call in calls:
+                try:
+                    call()
+                except Exception:
+                    pass
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            if elapsed_ns >= 200_000 or pilot_calls >= 10_000:
+                return elapsed_ns // pilot_calls
+            pilot_calls *= 10
+    
+    @staticmethod
+    def _pick_inner_iters(per_call_ns: int) -> int:
+        """Batch size that keeps the two timer reads small next to the timed calls"""
+        if per_call_ns < 1_000:
+            return 1000
+        if per_call_ns < 1_000_000:
+            return 10
+        return 1
+    
     def print_results(self):
         """Print benchmark results in a formatted way"""
         print("\n" + "=" * 80)
@@ -159,18 +406,27 @@ class PerformanceBenchmark:
         
         for result in self.results:
             print(f"\n🔍 {result.operation}")
-            print(f"   ⏱️  Average Duration: {result.avg_duration:.4f}s")
-            print(f"   📈 Min/Max Duration: {result.min_duration:.4f}s / {result.max_duration:.4f}s")
-            print(f"   📊 Standard Deviation: {result.std_deviation:.4f}s")
-            if PSUTIL_AVAILABLE:
+            print(f"   ⏱️  Median Duration: {result.median_duration:.6f}s")
+            print(f"   ⚡ Best Case (min): {result.min_duration:.6f}s")
+            print(f"   📐 Mean / 10% Trimmed Mean: {result.avg_duration:.6f}s / {result.trimmed_mean:.6f}s")
+            if "p95_duration" in result.details:
+                print(f"   🎯 p95 / p99: {result.details['p95_duration']:.6f}s / {result.details['p99_duration']:.6f}s")
+            print(f"   📈 Max Duration: {result.max_duration:.6f}s")
+            print(f"   📊 Standard Deviation: {result.std_deviation:.6f}s")
+            if self.memory_tracked:
                 print(f"   💾 Memory Usage: {result.memory_usage:.2f} MB")
             else:
                 print(f"   💾 Memory Usage: {result.memory_usage:.2f} MB (estimated)")
             print(f"   ✅ Success Rate: {result.success_rate:.1%}")
-            print(f"   🔄 Iterations: {result.iterations}")
+            print(f"   🔄 Iterations: {result.iterations} x {result.details.get('inner_iters', 1)} calls")
     
     def export_results(self, filename: str = "benchmark_results.json"):
-        """Export results to JSON file"""
+        """Export results to JSON file (with orjson when installed, which is much faster on long sample lists)"""
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        
         data = []
         for result in self.results:
             data.append({
@@ -179,277 +435,175 @@ class PerformanceBenchmark:
                 "min_duration": result.min_duration,
                 "max_duration": result.max_duration,
                 "std_deviation": result.std_deviation,
+                "median_duration": result.median_duration,
+                "trimmed_mean": result.trimmed_mean,
                 "memory_usage": result.memory_usage,
                 "success_rate": result.success_rate,
                 "iterations": result.iterations,
                 "details": result.details
             })
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            import json
+            
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
         
         print(f"📁 Results exported to {filename}")
 
-def benchmark_config_manager():
-    """Benchmark configuration manager operations"""
-    
-    print("🧪 BENCHMARKING CONFIGURATION MANAGER")
-    print("=" * 50)
+# Each benchmark group is a generator of (operation, func, options) rows, where
+# options are extra benchmark_function arguments. Imports and singleton
+# lookups happen inside the generator, so they only run for selected groups.
+
+def config_manager_benchmarks():
+    """Configuration manager operations"""
+    from skool_modules.config_manager import get_config, set_config
     
-    benchmark = PerformanceBenchmark()
+    yield "Config Loading", lambda: get_config('SKOOL_BASE_URL'), {}
     
-    # Import config manager
-    from skool_modules.config_manager import get_config, set_config
+    # Memoized reads, to see how much a cache in config_manager would buy:
+    # "cold" clears the cache before every read, "warm" always hits it
+    cached_get_config = functools.lru_cache(maxsize=128)(get_config)
     
-    # Benchmark config loading
-    def test_config_loading():
-        return get_config('SKOOL_BASE_URL')
+    def config_loading_cold():
+        cached_get_config.cache_clear()
+        return cached_get_config('SKOOL_BASE_URL')
     
-    result = benchmark.benchmark_function(test_config_loading, "Config Loading", 100)
-    print(f"✅ Config loading: {result.avg_duration:.6f}s avg")
+    yield "Config Loading (cold)", config_loading_cold, {}
+    yield "Config Loading (warm)", lambda: cached_get_config('SKOOL_BASE_URL'), {}
     
-    # Benchmark config setting
-    def test_config_setting():
+    def config_setting():
         set_config('TEST_BENCHMARK', 'value')
         return get_config('TEST_BENCHMARK')
     
-    result = benchmark.benchmark_function(test_config_setting, "Config Setting", 100)
-    print(f"✅ Config setting: {result.avg_duration:.6f}s avg")
-    
-    return benchmark
+    yield "Config Setting", config_setting, {}
 
-def benchmark_logger():
-    """Benchmark logging operations"""
-    
-    print("\n🧪 BENCHMARKING LOGGER")
-    print("=" * 50)
-    
-    benchmark = PerformanceBenchmark()
-    
-    # Import logger
+def logger_benchmarks():
+    """Logging operations"""
     from skool_modules.logger import get_logger, log_info, log_error
     
     logger = get_logger()
     
-    # Benchmark basic logging
-    def test_basic_logging():
-        logger.info("Test log message")
+    yield "Basic Logging", lambda: logger.info("Test log message"), {}
     
-    result = benchmark.benchmark_function(test_basic_logging, "Basic Logging", 100)
-    print(f"✅ Basic logging: {result.avg_duration:.6f}s avg")
-    
-    # Benchmark convenience functions
-    def test_convenience_logging():
+    def convenience_logging():
         log_info("Test info message")
         log_error("Test error message")
     
-    result = benchmark.benchmark_function(test_convenience_logging, "Convenience Logging", 100)
-    print(f"✅ Convenience logging: {result.avg_duration:.6f}s avg")
-    
-    # Benchmark structured logging
-    def test_structured_logging():
-        data = {"test": "data", "number": 123}
-        logger.log_dict(data, "info")
-    
-    result = benchmark.benchmark_function(test_structured_logging, "Structured Logging", 100)
-    print(f"✅ Structured logging: {result.avg_duration:.6f}s avg")
-    
-    return benchmark
+    yield "Convenience Logging", convenience_logging, {}
+    yield "Structured Logging", lambda: logger.log_dict({"test": "data", "number": 123}, "info"), {}
 
-def benchmark_error_handler():
-    """Benchmark error handling operations"""
-    
-    print("\n🧪 BENCHMARKING ERROR HANDLER")
-    print("=" * 50)
-    
-    benchmark = PerformanceBenchmark()
-    
-    # Import error handler
+def error_handler_benchmarks():
+    """Error handling operations"""
     from skool_modules.error_handler import safe_execute, handle_error, NetworkError
     
-    # Benchmark safe_execute with success
-    def test_safe_execute_success():
-        def success_function():
-            return "success"
-        return safe_execute(success_function)
+    def error_function():
+        raise NetworkError("Test error")
     
-    result = benchmark.benchmark_function(test_safe_execute_success, "Safe Execute Success", 100)
-    print(f"✅ Safe execute success: {result.avg_duration:.6f}s avg")
-    
-    # Benchmark safe_execute with error
-    def test_safe_execute_error():
-        def error_function():
-            raise NetworkError("Test error")
-        return safe_execute(error_function)
+    yield "Safe Execute Success", lambda: safe_execute(lambda: "success"), {}
+    yield "Safe Execute Error", lambda: safe_execute(error_function), {}
     
-    result = benchmark.benchmark_function(test_safe_execute_error, "Safe Execute Error", 100)
-    print(f"✅ Safe execute error: {result.avg_duration:.6f}s avg")
-    
-    # Benchmark direct error handling
-    def test_direct_error_handling():
+    def direct_error_handling():
         try:
             raise NetworkError("Test error")
         except Exception as e:
             return handle_error(e, {"test": True})
     
-    result = benchmark.benchmark_function(test_direct_error_handling, "Direct Error Handling", 100)
-    print(f"✅ Direct error handling: {result.avg_duration:.6f}s avg")
-    
-    return benchmark
+    yield "Direct Error Handling", direct_error_handling, {}
 
-def benchmark_video_extractor():
-    """Benchmark video extraction operations"""
-    
-    print("\n🧪 BENCHMARKING VIDEO EXTRACTOR")
-    print("=" * 50)
-    
-    benchmark = PerformanceBenchmark()
-    
-    # Import video extractor
-    from skool_modules.video_extractor import get_video_extractor, extract_video_url
-    
-    # Create mock driver
+def video_extractor_benchmarks():
+    """Video extraction operations"""
+    from skool_modules.video_extractor import (
+        VideoExtractor, get_video_extractor, extract_video_url, _classify_video_url
+    )
     from test_selenium_mocks import create_mock_driver_with_video_data
     
-    # Benchmark video extractor initialization
-    def test_extractor_init():
-        return get_video_extractor()
+    # get_video_extractor is cached, so it would only time a cache hit; build a fresh one
+    yield "Video Extractor Init", VideoExtractor, {}
     
-    result = benchmark.benchmark_function(test_extractor_init, "Video Extractor Init", 50)
-    print(f"✅ Extractor initialization: {result.avg_duration:.6f}s avg")
-    
-    # Benchmark video extraction with mock data
-    def test_video_extraction():
-        driver = create_mock_driver_with_video_data("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
-        return extract_video_url(driver, "Test Lesson")
-    
-    result = benchmark.benchmark_function(test_video_extraction, "Video Extraction", 100)
-    print(f"✅ Video extraction: {result.avg_duration:.6f}s avg")
-    
-    # Benchmark statistics retrieval
-    def test_statistics_retrieval():
-        extractor = get_video_extractor()
-        return extractor.get_extraction_statistics()
-    
-    result = benchmark.benchmark_function(test_statistics_retrieval, "Statistics Retrieval", 100)
-    print(f"✅ Statistics retrieval: {result.avg_duration:.6f}s avg")
+    # The drivers are built in setup, outside the timing, so only the
+    # extraction itself is measured
+    def make_video_driver():
+        return create_mock_driver_with_video_data("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
     
-    return benchmark
+    yield ("Video Extraction", lambda driver: extract_video_url(driver, "Test Lesson"),
+           {"setup": make_video_driver})
+    
+    # The singleton is resolved once, outside the timing
+    yield "Statistics Retrieval", get_video_extractor().get_extraction_statistics, {}
+    
+    # One URL per platform and form, so both the host lookup and the marker scan are tracked;
+    # classification is memoized, so its undecorated form measures the scan itself
+    urls = (
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ", "https://youtu.be/dQw4w9WgXcQ",
+        "https://player.vimeo.com/embed/123456789", "https://www.loom.com/share/abc123",
+        "https://fast.wistia.com/embed/xyz789", "https://example.com/video.mp4",
+        "https://www.google.com/search?q=video",
+    )
+    extractor = get_video_extractor()
+    classify = _classify_video_url.__wrapped__
+    
+    yield "URL Platform Detection", lambda: [extractor._detect_platform(url) for url in urls], {}
+    yield "URL Classification (uncached)", lambda: [classify(url) for url in urls], {}
 
-def benchmark_browser_manager():
-    """Benchmark browser manager operations"""
-    
-    print("\n🧪 BENCHMARKING BROWSER MANAGER")
-    print("=" * 50)
-    
-    benchmark = PerformanceBenchmark()
-    
-    # Import browser manager
+def browser_manager_benchmarks():
+    """Browser manager operations"""
     from skool_modules.browser_manager import should_use_browser_isolation
     
-    # Benchmark isolation decision logic
-    def test_isolation_decision():
-        return should_use_browser_isolation("Test Lesson", 5, 10)
+    # Inputs that hit different branches (early lesson, normal, periodic
+    # cleanup), not one repeated call
+    isolation_args = [("Intro", 1, 10), ("Advanced", 4, 10), ("Lesson 5", 5, 10), ("Welcome", 6, 10)]
     
-    result = benchmark.benchmark_function(test_isolation_decision, "Isolation Decision", 1000)
-    print(f"✅ Isolation decision: {result.avg_duration:.6f}s avg")
+    yield ("Isolation Decision", lambda args: should_use_browser_isolation(*args),
+           {"per_iter_args": isolation_args})
     
-    # Benchmark multiple isolation decisions
-    def test_multiple_isolation_decisions():
-        results = []
-        for i in range(1, 11):
-            results.append(should_use_browser_isolation(f"Lesson {i}", i, 10))
-        return results
+    def multiple_isolation_decisions():
+        return [should_use_browser_isolation(f"Lesson {i}", i, 10) for i in range(1, 11)]
     
-    result = benchmark.benchmark_function(test_multiple_isolation_decisions, "Multiple Isolation Decisions", 100)
-    print(f"✅ Multiple isolation decisions: {result.avg_duration:.6f}s avg")
-    
-    return benchmark
+    yield "Multiple Isolation Decisions", multiple_isolation_decisions, {}
 
-def benchmark_mock_objects():
-    """Benchmark mock object operations"""
-    
-    print("\n🧪 BENCHMARKING MOCK OBJECTS")
-    print("=" * 50)
-    
-    benchmark = PerformanceBenchmark()
-    
-    # Import mock objects
+def mock_objects_benchmarks():
+    """Mock object operations"""
     from test_selenium_mocks import MockWebDriver, MockWebElement, create_mock_driver_with_video_data
     
-    # Benchmark mock driver creation
-    def test_mock_driver_creation():
-        return MockWebDriver()
-    
-    result = benchmark.benchmark_function(test_mock_driver_creation, "Mock Driver Creation", 1000)
-    print(f"✅ Mock driver creation: {result.avg_duration:.6f}s avg")
-    
-    # Benchmark mock element creation
-    def test_mock_element_creation():
-        return MockWebElement("div", "Test text", {"id": "test"})
-    
-    result = benchmark.benchmark_function(test_mock_element_creation, "Mock Element Creation", 1000)
-    print(f"✅ Mock element creation: {result.avg_duration:.6f}s avg")
+    yield "Mock Driver Creation", MockWebDriver, {}
+    yield "Mock Element Creation", lambda: MockWebElement("div", "Test text", {"id": "test"}), {}
+    yield ("Mock Driver with Video Data",
+           lambda: create_mock_driver_with_video_data("https://www.youtube.com/watch?v=dQw4w9WgXcQ"), {})
     
-    # Benchmark mock driver with video data
-    def test_mock_driver_with_video():
-        return create_mock_driver_with_video_data("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
-    
-    result = benchmark.benchmark_function(test_mock_driver_with_video, "Mock Driver with Video Data", 100)
-    print(f"✅ Mock driver with video data: {result.avg_duration:.6f}s avg")
-    
-    # Benchmark element finding
-    def test_element_finding():
+    def element_finding():
         driver = MockWebDriver()
         driver.add_element("test", MockWebElement("div", "Test"))
         return driver.find_element("id", "test")
     
-    result = benchmark.benchmark_function(test_element_finding, "Element Finding", 1000)
-    print(f"✅ Element finding: {result.avg_duration:.6f}s avg")
-    
-    return benchmark
+    yield "Element Finding", element_finding, {}
 
-def benchmark_integration_workflow():
-    """Benchmark complete integration workflow"""
-    
-    print("\n🧪 BENCHMARKING INTEGRATION WORKFLOW")
-    print("=" * 50)
-    
-    benchmark = PerformanceBenchmark()
-    
-    # Import all modules
+def integration_workflow_benchmarks():
+    """Complete integration workflows"""
     from skool_modules.config_manager import get_config
     from skool_modules.logger import get_logger
-    from skool_modules.error_handler import safe_execute
     from skool_modules.video_extractor import extract_video_url
     from test_selenium_mocks import create_mock_driver_with_video_data
     
-    # Benchmark complete lesson extraction workflow
-    def test_complete_lesson_workflow():
-        # Step 1: Configuration
+    # Resolve the logger singleton once so the workflows time the logging, not the lookup
+    logger = get_logger()
+    
+    def complete_lesson_workflow():
         base_url = get_config('SKOOL_BASE_URL')
-        
-        # Step 2: Logger
-        logger = get_logger()
         logger.info("Starting lesson extraction")
         
-        # Step 3: Create mock driver
         driver = create_mock_driver_with_video_data("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
-        
-        # Step 4: Extract video
         video_url = extract_video_url(driver, "Test Lesson")
         
-        # Step 5: Log results
         logger.success(f"Extracted video: {video_url}")
-        
         return video_url
     
-    result = benchmark.benchmark_function(test_complete_lesson_workflow, "Complete Lesson Workflow", 50)
-    print(f"✅ Complete lesson workflow: {result.avg_duration:.6f}s avg")
+    yield "Complete Lesson Workflow", complete_lesson_workflow, {}
     
-    # Benchmark community extraction workflow
-    def test_community_workflow():
-        logger = get_logger()
+    def community_workflow():
         logger.info("Starting community extraction")
         
         lessons = []
@@ -461,47 +615,32 @@ def benchmark_integration_workflow():
         logger.success(f"Extracted {len(lessons)} lessons")
         return lessons
     
-    result = benchmark.benchmark_function(test_community_workflow, "Community Workflow", 20)
-    print(f"✅ Community workflow: {result.avg_duration:.6f}s avg")
-    
-    return benchmark
+    yield "Community Workflow", community_workflow, {}
 
-def benchmark_memory_usage():
-    """Benchmark memory usage patterns"""
-    
-    print("\n🧪 BENCHMARKING MEMORY USAGE")
-    print("=" * 50)
-    
-    benchmark = PerformanceBenchmark()
-    
-    # Import modules
+def memory_usage_benchmarks():
+    """Memory usage patterns"""
     from skool_modules.logger import get_logger
-    from skool_modules.video_extractor import get_video_extractor
+    from skool_modules.video_extractor import extract_video_url
     from test_selenium_mocks import MockWebDriver, MockWebElement
     
-    # Benchmark logger memory usage
-    def test_logger_memory():
-        logger = get_logger()
+    logger = get_logger()
+    
+    def logger_memory():
         for i in range(100):
             logger.info(f"Log message {i}")
         return True
     
-    result = benchmark.benchmark_function(test_logger_memory, "Logger Memory Usage", 10)
-    print(f"✅ Logger memory usage: {result.memory_usage:.2f} MB avg")
+    yield "Logger Memory Usage", logger_memory, {"iterations": 10}
     
-    # Benchmark video extractor memory usage
-    def test_video_extractor_memory():
-        extractor = get_video_extractor()
+    def video_extractor_memory():
         for i in range(50):
             driver = MockWebDriver()
             extract_video_url(driver, f"Lesson {i}")
         return True
     
-    result = benchmark.benchmark_function(test_video_extractor_memory, "Video Extractor Memory Usage", 10)
-    print(f"✅ Video extractor memory usage: {result.memory_usage:.2f} MB avg")
+    yield "Video Extractor Memory Usage", video_extractor_memory, {"iterations": 10}
     
-    # Benchmark mock objects memory usage
-    def test_mock_objects_memory():
+    def mock_objects_memory():
         drivers = []
         for i in range(100):
             driver = MockWebDriver()
@@ -510,98 +649,137 @@ def benchmark_memory_usage():
             drivers.append(driver)
         return len(drivers)
     
-    result = benchmark.benchmark_function(test_mock_objects_memory, "Mock Objects Memory Usage", 5)
-    print(f"✅ Mock objects memory usage: {result.memory_usage:.2f} MB avg")
-    
-    return benchmark
+    yield "Mock Objects Memory Usage", mock_objects_memory, {"iterations": 5}
 
-def benchmark_concurrent_operations():
-    """Benchmark concurrent operations"""
-    
-    print("\n🧪 BENCHMARKING CONCURRENT OPERATIONS")
-    print("=" * 50)
-    
-    benchmark = PerformanceBenchmark()
-    
-    import threading
+def concurrent_operations_benchmarks():
+    """Concurrent operations"""
     from skool_modules.logger import get_logger
     from skool_modules.video_extractor import get_video_extractor
     from test_selenium_mocks import create_mock_driver_with_video_data
     
-    # Benchmark concurrent logging
-    def test_concurrent_logging():
-        logger = get_logger()
-        
-        def log_worker(worker_id):
-            for i in range(10):
-                logger.info(f"Worker {worker_id} - Message {i}")
-        
-        threads = []
+    pool = _get_pool()
+    
+    # Resolve the singletons once so the workers time contention, not the lookups
+    logger = get_logger()
+    extractor = get_video_extractor()
+    
+    def log_worker(worker_id):
+        for i in range(10):
+            logger.info(f"Worker {worker_id} - Message {i}")
+    
+    yield "Concurrent Logging", lambda: list(pool.map(log_worker, range(5))), {}
+    
+    def extraction_worker(worker_id):
         for i in range(5):
-            thread = threading.Thread(target=log_worker, args=(i,))
-            threads.append(thread)
-            thread.start()
-        
-        for thread in threads:
-            thread.join()
-        
-        return True
+            # 11-character IDs, so the mock URLs pass the YouTube pattern check
+            driver = create_mock_driver_with_video_data(f"https://www.youtube.com/watch?v=video{worker_id:03d}_{i:02d}")
+            extractor.extract_video_url(driver, f"Lesson {worker_id}_{i}")
     
-    result = benchmark.benchmark_function(test_concurrent_logging, "Concurrent Logging", 10)
-    print(f"✅ Concurrent logging: {result.avg_duration:.6f}s avg")
+    yield "Concurrent Video Extraction", lambda: list(pool.map(extraction_worker, range(3))), {}
+
+# (group name, heading, row generator, what the progress line reports, modules it imports)
+BENCHMARKS = [
+    ("config_manager", "CONFIGURATION MANAGER", config_manager_benchmarks, "duration",
+     ("skool_modules.config_manager",)),
+    ("logger", "LOGGER", logger_benchmarks, "duration",
+     ("skool_modules.logger",)),
+    ("error_handler", "ERROR HANDLER", error_handler_benchmarks, "duration",
+     ("skool_modules.error_handler",)),
+    ("video_extractor", "VIDEO EXTRACTOR", video_extractor_benchmarks, "duration",
+     ("skool_modules.video_extractor", "test_selenium_mocks")),
+    ("browser_manager", "BROWSER MANAGER", browser_manager_benchmarks, "duration",
+     ("skool_modules.browser_manager",)),
+    ("mock_objects", "MOCK OBJECTS", mock_objects_benchmarks, "duration",
+     ("test_selenium_mocks",)),
+    ("integration_workflow", "INTEGRATION WORKFLOW", integration_workflow_benchmarks, "duration",
+     ("skool_modules.config_manager", "skool_modules.logger", "skool_modules.video_extractor",
+      "test_selenium_mocks")),
+    ("memory_usage", "MEMORY USAGE", memory_usage_benchmarks, "memory",
+     ("skool_modules.logger", "skool_modules.video_extractor", "test_selenium_mocks")),
+    ("concurrent_operations", "CONCURRENT OPERATIONS", concurrent_operations_benchmarks, "duration",
+     ("skool_modules.logger", "skool_modules.video_extractor", "test_selenium_mocks")),
+]
+
+def run_benchmarks(selection: Optional[List[str]] = None, pin_cpu: bool = False) -> List[BenchmarkResult]:
+    """Run the benchmark groups whose name contains one of `selection` (all groups when empty)"""
+    
+    groups = [group for group in BENCHMARKS
+              if not selection or any(name in group[0] for name in selection)]
+    if not groups:
+        print(f"❌ No benchmark groups match {', '.join(selection)}")
+        return []
+    
+    # Load every module the selected groups use in one go, before any timing
+    # starts, so no group pays first-import costs part-way through the run
+    import importlib
+    for module_name in dict.fromkeys(module for group in groups for module in group[4]):
+        importlib.import_module(module_name)
+    
+    if pin_cpu:
+        cpu = PerformanceBenchmark._pin_to_cpu()
+        if cpu is not None:
+            print(f"📌 Benchmarks pinned to CPU {cpu}")
     
-    # Benchmark concurrent video extraction
-    def test_concurrent_video_extraction():
-        extractor = get_video_extractor()
-        
-        def extraction_worker(worker_id):
-            for i in range(5):
-                driver = create_mock_driver_with_video_data(f"https://www.youtube.com/watch?v=video{worker_id}_{i}")
-                extract_video_url(driver, f"Lesson {worker_id}_{i}")
-        
-        threads = []
-        for i in range(3):
-            thread = threading.Thread(target=extraction_worker, args=(i,))
-            threads.append(thread)
-            thread.start()
-        
-        for thread in threads:
-            thread.join()
-        
-        return True
+    all_results = []
+    failed_groups = []
     
-    result = benchmark.benchmark_function(test_concurrent_video_extraction, "Concurrent Video Extraction", 10)
-    print(f"✅ Concurrent video extraction: {result.avg_duration:.6f}s avg")
+    try:
+        for name, heading, rows, report, _ in groups:
+            print(f"\n🧪 BENCHMARKING {heading}")
+            print("=" * 50)
+            
+            benchmark = PerformanceBenchmark()
+            try:
+                for operation, func, options in rows():
+                    result = benchmark.benchmark_function(func, operation, **options)
+                    if report == "memory":
+                        print(f"✅ {operation}: {result.memory_usage:.2f} MB avg")
+                    else:
+                        print(f"✅ {operation}: {result.median_duration:.6f}s median")
+            except Exception as e:
+                print(f"❌ Benchmark group {name} failed: {e}")
+                failed_groups.append(name)
+            all_results.extend(benchmark.results)
+    finally:
+        _shutdown_pool()
     
-    return benchmark
+    # A broken benchmark must not pass for a fast one
+    if failed_groups:
+        raise RuntimeError(f"benchmark groups failed: {', '.join(failed_groups)}")
+    
+    return all_results
 
-def run_all_benchmarks():
-    """Run all performance benchmarks"""
+def load_baseline(filename: str) -> Dict[str, float]:
+    """Median duration per operation from an earlier export_results file"""
+    import json
+    
+    with open(filename) as f:
+        return {entry["operation"]: entry["median_duration"]
+                for entry in json.load(f) if entry.get("median_duration")}
+
+def find_regressions(results: Sequence[BenchmarkResult], baseline: Dict[str, float],
+                     max_regression: float) -> List[str]:
+    """Describe each operation whose median is more than max_regression (a fraction) above baseline"""
+    regressions = []
+    for result in results:
+        before = baseline.get(result.operation)
+        if before and result.median_duration > before * (1 + max_regression):
+            regressions.append(f"{result.operation}: {before:.9f}s -> {result.median_duration:.9f}s "
+                               f"(+{result.median_duration / before - 1:.0%})")
+    return regressions
+
+def run_all_benchmarks(select: Optional[List[str]] = None, pin_cpu: bool = False) -> List[BenchmarkResult]:
+    """Run all performance benchmarks, or only the groups whose name contains one of `select`"""
     
     print("🚀 Starting Performance Benchmarks")
     print("=" * 60)
     
-    # Run all benchmarks
-    benchmarks = [
-        benchmark_config_manager,
-        benchmark_logger,
-        benchmark_error_handler,
-        benchmark_video_extractor,
-        benchmark_browser_manager,
-        benchmark_mock_objects,
-        benchmark_integration_workflow,
-        benchmark_memory_usage,
-        benchmark_concurrent_operations
-    ]
-    
-    all_results = []
+    # Skipped groups never run, so their imports never load
+    all_results = run_benchmarks(select, pin_cpu)
+    if not all_results:
+        return all_results
     
-    for benchmark_func in benchmarks:
-        try:
-            benchmark = benchmark_func()
-            all_results.extend(benchmark.results)
-        except Exception as e:
-            print(f"❌ Benchmark {benchmark_func.__name__} failed: {e}")
+    import statistics
     
     # Create combined benchmark object
     combined_benchmark = PerformanceBenchmark()
@@ -620,11 +798,11 @@ def run_all_benchmarks():
     
     # Find fastest and slowest operations
     if all_results:
-        fastest = min(all_results, key=lambda x: x.avg_duration)
-        slowest = max(all_results, key=lambda x: x.avg_duration)
+        fastest = min(all_results, key=lambda x: x.median_duration)
+        slowest = max(all_results, key=lambda x: x.median_duration)
         
-        print(f"\n⚡ Fastest Operation: {fastest.operation} ({fastest.avg_duration:.6f}s)")
-        print(f"🐌 Slowest Operation: {slowest.operation} ({slowest.avg_duration:.6f}s)")
+        print(f"\n⚡ Fastest Operation: {fastest.operation} ({fastest.median_duration:.6f}s median)")
+        print(f"🐌 Slowest Operation: {slowest.operation} ({slowest.median_duration:.6f}s median)")
         
         # Calculate total time
         total_time = sum(r.avg_duration for r in all_results)
@@ -643,6 +821,37 @@ def run_all_benchmarks():
     print("\n" + "=" * 80)
     print("🎯 BENCHMARK COMPLETED")
     print("=" * 80)
+    
+    return all_results
 
 if __name__ == "__main__":
-    run_all_benchmarks()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run Skool scraper performance benchmarks")
+    parser.add_argument("--select", action="append", metavar="GROUP",
+                        help="only run benchmark groups whose name contains GROUP "
+                             "(comma-separated or repeated, e.g. --select config,logger)")
+    parser.add_argument("--pin-cpu", action="store_true",
+                        help="pin the process to one CPU to cut scheduler noise")
+    parser.add_argument("--compare", metavar="FILE",
+                        help="exit with status 1 when an operation's median regressed against FILE, "
+                             "an earlier benchmark_results.json (copy it first, this run overwrites it)")
+    parser.add_argument("--max-regression", type=float, default=20.0, metavar="PERCENT",
+                        help="median slowdown tolerated by --compare (default: 20)")
+    args = parser.parse_args()
+    
+    select = [name.strip() for value in args.select or [] for name in value.split(",") if name.strip()]
+    
+    # Read the baseline before the run exports over it
+    baseline = load_baseline(args.compare) if args.compare else None
+    results = run_all_benchmarks(select, args.pin_cpu)
+    
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, args.max_regression / 100)
+        if regressions:
+            print(f"\n❌ {len(regressions)} operation(s) regressed more than {args.max_regression:g}% "
+                  f"against {args.compare}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            sys.exit(1)
+        print(f"\n✅ No operation regressed more than {args.max_regression:g}% against {args.compare}")
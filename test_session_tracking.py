@@ -5,45 +5,65 @@ Test script for the enhanced session-level video tracking system
 
 import sys
 import os
-import json
+import logging
+from pathlib import Path
 
 # Add the current directory to Python path so we can import the main scraper
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Progress goes through logging so callers that only want the pass/fail result can
+# raise the level and skip the message formatting; __main__ turns on INFO output
+log = logging.getLogger(__name__)
+
+# In CI nobody inspects the saved report, so the file round-trip is skipped unless asked for
+WRITE_REPORT_FILE = not os.environ.get("CI") or bool(os.environ.get("KEEP_DEBUG_ARTIFACTS"))
+
+# Import the session tracking functions once for both tests; reset_session_tracking()
+# clears the tracking containers in place, so these bindings stay valid across resets
+try:
+    from skool_content_extractor import (
+        reset_session_tracking,
+        register_video_in_session,
+        register_videos_in_session,
+        check_session_duplicate_early,
+        print_session_statistics,
+        build_session_tracking_report,
+        save_session_tracking_report,
+        set_lesson_context,
+        _final_video_validation,
+        is_valid_lesson_video,
+        SESSION_STATS,
+        SESSION_VIDEO_TRACKING,
+        SEEN_VIDEO_IDS_SESSION
+    )
+    _IMPORT_ERROR = None
+except ImportError as e:
+    _IMPORT_ERROR = e
+
 def test_session_tracking_functions():
     """Test all session tracking functions without running the full scraper"""
     
-    print("🧪 TESTING SESSION-LEVEL VIDEO TRACKING SYSTEM")
-    print("=" * 60)
+    log.info("🧪 TESTING SESSION-LEVEL VIDEO TRACKING SYSTEM")
+    log.info("=" * 60)
+    
+    if _IMPORT_ERROR:
+        log.error("❌ Could not import session tracking functions: %s", _IMPORT_ERROR)
+        return False
     
     try:
-        # Import the session tracking functions
-        from skool_content_extractor import (
-            reset_session_tracking, 
-            register_video_in_session,
-            check_session_duplicate_early,
-            print_session_statistics,
-            save_session_tracking_report,
-            SESSION_STATS,
-            SESSION_VIDEO_TRACKING,
-            SEEN_VIDEO_IDS_SESSION
-        )
-        
-        print("✅ Successfully imported session tracking functions")
-        
         # Test 1: Reset session tracking
-        print("\n🔄 Testing reset_session_tracking()...")
+        log.info("\n🔄 Testing reset_session_tracking()...")
         reset_session_tracking()
         
         # Verify reset worked
         if len(SEEN_VIDEO_IDS_SESSION) == 0 and len(SESSION_VIDEO_TRACKING) == 0:
-            print("✅ Session tracking reset successfully")
+            log.info("✅ Session tracking reset successfully")
         else:
-            print("❌ Session tracking reset failed")
+            log.error("❌ Session tracking reset failed")
             return False
         
         # Test 2: Register new videos
-        print("\n📝 Testing register_video_in_session()...")
+        log.info("\n📝 Testing register_videos_in_session()...")
         
         test_videos = [
             {
@@ -66,30 +86,28 @@ def test_session_tracking_functions():
             }
         ]
         
-        # Register each video
-        for video in test_videos:
-            result = register_video_in_session(
-                video['url'], 
-                video['lesson'], 
-                video['method'], 
-                video['platform']
-            )
-            
+        # Register all videos in one batch
+        results = register_videos_in_session(
+            (video['url'], video['lesson'], video['method'], video['platform'])
+            for video in test_videos
+        )
+        
+        for video, result in zip(test_videos, results):
             if result:
-                print(f"✅ Successfully registered: {video['lesson']}")
+                log.info("✅ Successfully registered: %s", video['lesson'])
             else:
-                print(f"❌ Failed to register: {video['lesson']}")
+                log.error("❌ Failed to register: %s", video['lesson'])
                 return False
         
         # Verify registration worked
         if SESSION_STATS['unique_videos_found'] == 3:
-            print(f"✅ Correctly tracked {SESSION_STATS['unique_videos_found']} unique videos")
+            log.info("✅ Correctly tracked %s unique videos", SESSION_STATS['unique_videos_found'])
         else:
-            print(f"❌ Expected 3 videos, got {SESSION_STATS['unique_videos_found']}")
+            log.error("❌ Expected 3 videos, got %s", SESSION_STATS['unique_videos_found'])
             return False
         
         # Test 3: Duplicate detection
-        print("\n🔍 Testing duplicate detection...")
+        log.info("\n🔍 Testing duplicate detection...")
         
         # Try to register a duplicate
         duplicate_result = register_video_in_session(
@@ -100,14 +118,14 @@ def test_session_tracking_functions():
         )
         
         if not duplicate_result:
-            print("✅ Duplicate correctly detected and blocked")
-            print(f"✅ Duplicates blocked count: {SESSION_STATS['duplicates_blocked']}")
+            log.info("✅ Duplicate correctly detected and blocked")
+            log.info("✅ Duplicates blocked count: %s", SESSION_STATS['duplicates_blocked'])
         else:
-            print("❌ Duplicate was not detected!")
+            log.error("❌ Duplicate was not detected!")
             return False
         
         # Test 4: Early duplicate detection
-        print("\n⚡ Testing early duplicate detection...")
+        log.info("\n⚡ Testing early duplicate detection...")
         
         early_duplicate = check_session_duplicate_early(
             'https://www.loom.com/share/unique456',  # Same as second video
@@ -116,13 +134,13 @@ def test_session_tracking_functions():
         )
         
         if early_duplicate:
-            print("✅ Early duplicate detection working correctly")
+            log.info("✅ Early duplicate detection working correctly")
         else:
-            print("❌ Early duplicate detection failed")
+            log.error("❌ Early duplicate detection failed")
             return False
         
         # Test 5: Session statistics
-        print("\n📊 Testing session statistics...")
+        log.info("\n📊 Testing session statistics...")
         print_session_statistics()
         
         # Verify statistics
@@ -133,63 +151,62 @@ def test_session_tracking_functions():
             'duplicates_blocked': 1
         }
         
-        stats_correct = True
-        for key, expected_value in expected_stats.items():
-            actual_value = SESSION_STATS[key]
-            if actual_value != expected_value:
-                print(f"❌ Stats mismatch - {key}: expected {expected_value}, got {actual_value}")
-                stats_correct = False
+        mismatches = {
+            key: (expected_value, SESSION_STATS[key])
+            for key, expected_value in expected_stats.items()
+            if SESSION_STATS[key] != expected_value
+        }
         
-        if stats_correct:
-            print("✅ Session statistics are correct")
-        else:
+        if mismatches:
+            for key, (expected_value, actual_value) in mismatches.items():
+                log.error("❌ Stats mismatch - %s: expected %s, got %s", key, expected_value, actual_value)
             return False
         
+        log.info("✅ Session statistics are correct")
+        
         # Test 6: Session tracking report
-        print("\n💾 Testing save_session_tracking_report()...")
-        save_session_tracking_report()
+        log.info("\n💾 Testing build_session_tracking_report()...")
+        report_data = build_session_tracking_report()
+        
+        # Validate the report structure in memory rather than re-reading the saved file
+        required_sections = {'session_stats', 'video_tracking', 'seen_video_ids', 'report_generated'}
+        if required_sections <= report_data.keys():
+            log.info("✅ Session tracking report has correct structure")
+            log.info("✅ Report contains %s video entries", len(report_data['video_tracking']))
+        else:
+            log.error("❌ Session tracking report missing required sections")
+            return False
         
-        # Verify report file was created
-        if os.path.exists('debug_session_tracking_report.json'):
-            print("✅ Session tracking report file created")
+        if WRITE_REPORT_FILE:
+            log.info("\n💾 Testing save_session_tracking_report()...")
+            save_session_tracking_report()
             
-            # Read and validate the report
-            with open('debug_session_tracking_report.json', 'r', encoding='utf-8') as f:
-                report_data = json.load(f)
-            
-            required_sections = ['session_stats', 'video_tracking', 'seen_video_ids', 'report_generated']
-            if all(section in report_data for section in required_sections):
-                print("✅ Session tracking report has correct structure")
-                print(f"✅ Report contains {len(report_data['video_tracking'])} video entries")
+            # Verify report file was created
+            if os.path.exists('debug_session_tracking_report.json'):
+                log.info("✅ Session tracking report file created")
             else:
-                print("❌ Session tracking report missing required sections")
+                log.error("❌ Session tracking report file was not created")
                 return False
         else:
-            print("❌ Session tracking report file was not created")
-            return False
+            log.info("\n⏭️ Skipping report file write in CI (set KEEP_DEBUG_ARTIFACTS=1 to keep it)")
         
         return True
         
     except Exception as e:
-        print(f"❌ Testing failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Testing failed with error: %s", e)
         return False
 
 def test_integration_with_validation():
     """Test integration between session tracking and existing validation"""
     
-    print("\n🧪 TESTING INTEGRATION WITH VALIDATION SYSTEM")
-    print("=" * 50)
+    log.info("\n🧪 TESTING INTEGRATION WITH VALIDATION SYSTEM")
+    log.info("=" * 50)
+    
+    if _IMPORT_ERROR:
+        log.error("❌ Could not import validation functions: %s", _IMPORT_ERROR)
+        return False
     
     try:
-        from skool_content_extractor import (
-            _final_video_validation,
-            is_valid_lesson_video,
-            reset_session_tracking,
-            SESSION_STATS
-        )
-        
         # Reset for clean test
         reset_session_tracking()
         
@@ -208,9 +225,9 @@ def test_integration_with_validation():
         )
         
         if result:
-            print("✅ Valid video passed final validation with session tracking")
+            log.info("✅ Valid video passed final validation with session tracking")
         else:
-            print("❌ Valid video failed final validation")
+            log.error("❌ Valid video failed final validation")
             return False
         
         # Test that the same video is now blocked as duplicate
@@ -228,10 +245,10 @@ def test_integration_with_validation():
         )
         
         if not result2:
-            print("✅ Duplicate video correctly blocked by final validation")
-            print(f"✅ Session duplicates blocked: {SESSION_STATS['duplicates_blocked']}")
+            log.info("✅ Duplicate video correctly blocked by final validation")
+            log.info("✅ Session duplicates blocked: %s", SESSION_STATS['duplicates_blocked'])
         else:
-            print("❌ Duplicate video was not blocked!")
+            log.error("❌ Duplicate video was not blocked!")
             return False
         
         # Test known blacklisted video
@@ -249,19 +266,34 @@ def test_integration_with_validation():
         )
         
         if not result3:
-            print("✅ Blacklisted video correctly blocked by validation")
+            log.info("✅ Blacklisted video correctly blocked by validation")
         else:
-            print("❌ Blacklisted video was not blocked!")
+            log.error("❌ Blacklisted video was not blocked!")
             return False
         
         return True
         
     except Exception as e:
-        print(f"❌ Integration testing failed: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Integration testing failed: %s", e)
         return False
 
+def test_report_saves_after_lesson_context(tmp_path):
+    """The saved report must stay valid JSON once a lesson context is set"""
+    import json
+    
+    assert _IMPORT_ERROR is None, _IMPORT_ERROR
+    
+    reset_session_tracking()
+    set_lesson_context("Money Mindset Basics", "https://example.com/lesson", "lesson-1")
+    
+    # save_session_tracking_report only warns on failure, so read the file back
+    path = tmp_path / "report.json"
+    save_session_tracking_report(path)
+    with open(path, encoding='utf-8') as f:
+        report = json.load(f)
+    
+    assert report['lesson_context']['current_lesson_title'] == "Money Mindset Basics"
+
 def cleanup_test_files():
     """Clean up test files created during testing"""
     test_files = [
@@ -270,14 +302,18 @@ def cleanup_test_files():
     ]
     
     for file in test_files:
-        if os.path.exists(file):
-            try:
-                os.remove(file)
-                print(f"🧹 Cleaned up: {file}")
-            except Exception as e:
-                print(f"⚠️ Could not remove {file}: {e}")
+        try:
+            # Unlink directly instead of checking for the file first
+            Path(file).unlink()
+            log.info("🧹 Cleaned up: %s", file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.warning("⚠️ Could not remove %s: %s", file, e)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("🚀 Starting Enhanced Session Tracking System Tests")
     print()
     
@@ -288,20 +324,23 @@ if __name__ == "__main__":
     print()
     print("=" * 60)
     if test1_passed and test2_passed:
-        print("✅ ALL TESTS PASSED - Enhanced session tracking is working!")
-        print()
-        print("🎯 Key features verified:")
-        print("  • Session tracking reset and initialization")
-        print("  • Video registration with comprehensive metadata")
-        print("  • Early duplicate detection (before validation)")
-        print("  • Session-level duplicate prevention")
-        print("  • Integration with existing validation system")
-        print("  • Comprehensive session statistics")
-        print("  • Session tracking report generation")
-        print("  • Blacklist and session duplicate blocking")
-        print()
-        print("📄 Session report saved as: debug_session_tracking_report.json")
-        print("💡 This will prevent ANY video from being reused across lessons in a session")
+        # Emit the summary as one write rather than a print per line
+        print("\n".join([
+            "✅ ALL TESTS PASSED - Enhanced session tracking is working!",
+            "",
+            "🎯 Key features verified:",
+            "  • Session tracking reset and initialization",
+            "  • Video registration with comprehensive metadata",
+            "  • Early duplicate detection (before validation)",
+            "  • Session-level duplicate prevention",
+            "  • Integration with existing validation system",
+            "  • Comprehensive session statistics",
+            "  • Session tracking report generation",
+            "  • Blacklist and session duplicate blocking",
+            "",
+            "📄 Session report saved as: debug_session_tracking_report.json",
+            "💡 This will prevent ANY video from being reused across lessons in a session",
+        ]))
     else:
         print("❌ SOME TESTS FAILED - Check the issues above")
     
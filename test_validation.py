@@ -5,11 +5,39 @@ Quick test script to verify the validation function works correctly
 
 import sys
 import os
+import re
 
 # Add the current directory to the path so we can import from skool_content_extractor
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from skool_content_extractor import is_valid_lesson_video
+from skool_content_extractor import (
+    is_valid_lesson_video, is_valid_lesson_video_batch, _extract_validation_video_id
+)
+
+# Test cases - these should be BLOCKED
+BLOCKED_URLS = frozenset({
+    "https://youtu.be/65GvYDdzJWU",
+    "https://www.youtube.com/watch?v=65GvYDdzJWU",
+    "https://www.youtube.com/embed/65GvYDdzJWU",
+    "https://youtube-nocookie.com/embed/65GvYDdzJWU",
+    "https://youtu.be/UDcrRdfB0x8",
+    "https://youtu.be/7snrj0uEaDw",
+    "https://youtu.be/YTrIwmIdaJI",
+})
+
+# Test cases - these should be ALLOWED
+ALLOWED_URLS = frozenset({
+    "https://www.loom.com/share/a532feff0368460986b819412fb3a11a",
+    "https://www.loom.com/share/5b641b8e492c462e809712827d220ed3",
+    "https://youtu.be/DIFFERENT_VIDEO_ID",
+    "https://vimeo.com/123456789",
+})
+
+# YouTube video ID in the watch, embed, nocookie and youtu.be URL forms
+_YOUTUBE_ID_RE = re.compile(r'(?:v=|embed/|youtu\.be/)([A-Za-z0-9_-]{11})')
+
+# Distinct video IDs behind the blocked URLs; every blocked URL is one of these in another form
+EXPECTED_BLOCKED_IDS = frozenset({"65GvYDdzJWU", "UDcrRdfB0x8", "7snrj0uEaDw", "YTrIwmIdaJI"})
 
 def test_validation():
     """Test the validation function with known duplicate URLs"""
@@ -17,40 +45,49 @@ def test_validation():
     print("🧪 TESTING VALIDATION FUNCTION")
     print("=" * 50)
     
-    # Test cases - these should be BLOCKED
-    blocked_urls = [
-        "https://youtu.be/65GvYDdzJWU",
-        "https://www.youtube.com/watch?v=65GvYDdzJWU",
-        "https://www.youtube.com/embed/65GvYDdzJWU",
-        "https://youtube-nocookie.com/embed/65GvYDdzJWU",
-        "https://youtu.be/UDcrRdfB0x8",
-        "https://youtu.be/7snrj0uEaDw",
-        "https://youtu.be/YTrIwmIdaJI",
-    ]
-    
-    # Test cases - these should be ALLOWED
-    allowed_urls = [
-        "https://www.loom.com/share/a532feff0368460986b819412fb3a11a",
-        "https://www.loom.com/share/5b641b8e492c462e809712827d220ed3",
-        "https://youtu.be/DIFFERENT_VIDEO_ID",
-        "https://vimeo.com/123456789",
-    ]
-    
-    print("\n🚫 TESTING BLOCKED URLs (should return False):")
+    # The blocked URLs only differ in URL form (checked by test_blocked_id_canonicalization),
+    # so validate each distinct video once through its canonical youtu.be URL
+    unique_blocked_ids = {_YOUTUBE_ID_RE.search(url).group(1) for url in BLOCKED_URLS}
+    blocked_probes = {f"https://youtu.be/{video_id}": video_id for video_id in unique_blocked_ids}
+    allowed_urls = list(ALLOWED_URLS)
+    
+    urls = list(blocked_probes) + allowed_urls
+    results = dict(zip(urls, is_valid_lesson_video_batch(urls)))
+    
+    incorrectly_allowed = {blocked_probes[url] for url in blocked_probes if results[url]}
+    incorrectly_blocked = {url for url in allowed_urls if not results[url]}
+    
+    print("\n🚫 BLOCKED VIDEO IDs (should return False):")
     print("-" * 40)
-    for url in blocked_urls:
-        result = is_valid_lesson_video(url)
-        status = "✅ CORRECTLY BLOCKED" if not result else "❌ INCORRECTLY ALLOWED"
-        print(f"{status}: {url}")
-        print()
+    for video_id in sorted(unique_blocked_ids):
+        status = "❌ INCORRECTLY ALLOWED" if video_id in incorrectly_allowed else "✅ CORRECTLY BLOCKED"
+        print(f"{status}: {video_id}")
     
-    print("\n✅ TESTING ALLOWED URLs (should return True):")
+    print("\n✅ ALLOWED URLs (should return True):")
     print("-" * 40)
-    for url in allowed_urls:
-        result = is_valid_lesson_video(url)
-        status = "✅ CORRECTLY ALLOWED" if result else "❌ INCORRECTLY BLOCKED"
+    for url in sorted(ALLOWED_URLS):
+        status = "❌ INCORRECTLY BLOCKED" if url in incorrectly_blocked else "✅ CORRECTLY ALLOWED"
         print(f"{status}: {url}")
-        print()
+    
+    assert not incorrectly_allowed, f"Blocked videos were allowed: {sorted(incorrectly_allowed)}"
+    assert not incorrectly_blocked, f"Allowed URLs were blocked: {sorted(incorrectly_blocked)}"
+
+def test_blocked_id_canonicalization():
+    """Every URL form of a blocked video must resolve to the same blacklisted ID"""
+    
+    assert {_YOUTUBE_ID_RE.search(url).group(1) for url in BLOCKED_URLS} == EXPECTED_BLOCKED_IDS
+    assert {_extract_validation_video_id(url) for url in BLOCKED_URLS} == EXPECTED_BLOCKED_IDS
+    
+    variant_ids = {_extract_validation_video_id(url) for url in BLOCKED_URLS if "65GvYDdzJWU" in url}
+    assert variant_ids == {"65GvYDdzJWU"}
+
+def test_batch_matches_single_validation():
+    """The batch validator must agree with is_valid_lesson_video URL by URL"""
+    
+    urls = sorted(BLOCKED_URLS | ALLOWED_URLS) + ["", None]
+    assert is_valid_lesson_video_batch(urls) == [is_valid_lesson_video(url) for url in urls]
 
 if __name__ == "__main__":
     test_validation()
+    test_blocked_id_canonicalization()
+    test_batch_matches_single_validation()
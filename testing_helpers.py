@@ -0,0 +1,19 @@
+"""
+Helpers shared by the test scripts' __main__ blocks
+"""
+
+import importlib.util
+
+import pytest
+
+
+def run_pytest(*pytest_args: str) -> int:
+    """Run pytest for a test script's __main__ block, across all cores when pytest-xdist is installed"""
+    
+    pytest_args = list(pytest_args)
+    if importlib.util.find_spec("xdist") is not None:
+        pytest_args += ["-n", "auto"]
+    else:
+        print("⚠️ pytest-xdist not available, running tests sequentially")
+    
+    return pytest.main(pytest_args)